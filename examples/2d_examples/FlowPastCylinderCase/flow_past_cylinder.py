@@ -95,6 +95,11 @@ def flow_past_cylinder_boundary_forcing_case(
         master_rank=master_rank,
     )
 
+    # rank and timescale dependent quantities do not change over the
+    # simulation, hence resolve them once outside the time-stepping loop
+    is_master_rank = flow_sim.mpi_construct.rank == master_rank
+    drag_coeff_scale = 1.0 / (velocity_scale * velocity_scale * cyl_radius)
+
     while flow_sim.time < final_time:
 
         # Plot solution
@@ -135,7 +140,7 @@ def flow_past_cylinder_boundary_forcing_case(
         # track diagnostic data
         if data_timer >= data_timer_limit or data_timer == 0:
             data_timer = 0.0
-            if flow_sim.mpi_construct.rank == master_rank:
+            if is_master_rank:
                 drag_coeffs_time.append(flow_sim.time / timescale)
                 # calculate drag
                 F = np.sum(
@@ -143,7 +148,7 @@ def flow_past_cylinder_boundary_forcing_case(
                         x_axis_idx, ...
                     ]
                 )
-                drag_coeff = np.fabs(F) / velocity_scale / velocity_scale / cyl_radius
+                drag_coeff = np.fabs(F) * drag_coeff_scale
                 drag_coeffs.append(drag_coeff)
 
         dt = flow_sim.compute_stable_timestep()
@@ -169,7 +174,7 @@ def flow_past_cylinder_boundary_forcing_case(
     mpi_plotter.clearfig()
 
     # compile video and save diagnostics data
-    if flow_sim.mpi_construct.rank == master_rank:
+    if is_master_rank:
         os.system("rm -f flow.mp4")
         os.system(
             "ffmpeg -r 10 -s 3840x2160 -f image2 -pattern_type glob -i 'snap*.png' "
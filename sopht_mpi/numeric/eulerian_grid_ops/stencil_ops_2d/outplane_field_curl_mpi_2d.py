@@ -1,19 +1,116 @@
 """MPI-supported kernels for computing curl of outplane field in 2D."""
+from dataclasses import replace
+from functools import lru_cache
+import pystencils as ps
+from pystencils.backends.simd_instruction_sets import (
+    get_supported_instruction_sets,
+    get_vector_instruction_set,
+)
+import sympy as sp
 from sopht.numeric.eulerian_grid_ops.stencil_ops_2d import (
-    gen_outplane_field_curl_pyst_kernel_2d,
     gen_set_fixed_val_pyst_kernel_2d,
 )
+from sopht.utils.pyst_kernel_config import get_pyst_dtype, get_pyst_kernel_config
 from sopht_mpi.utils.mpi_utils import check_valid_ghost_size_and_kernel_support
 from mpi4py import MPI
 
 
+@lru_cache(maxsize=None)
+def _gen_outplane_field_curl_pyst_kernels_2d(
+    real_t, local_grid_size_y, local_grid_size_x, ghost_size, kernel_support
+):
+    """Generates the interior and boundary 2D outplane field curl kernels.
+
+    The kernels are specialised to the local grid size (with ghost zone), hence
+    they are cached based on precision, local grid size and ghost size, so that
+    simulators with the same local setup reuse the compiled kernels.
+    """
+    # The local field shape (with ghost zone) is fixed once the MPI construct
+    # is created, hence we bake it into the kernels below, so that pystencils
+    # emits loops with fixed trip counts and strides.
+    grid_size_y = local_grid_size_y + 2 * ghost_size
+    grid_size_x = local_grid_size_x + 2 * ghost_size
+    pyst_dtype = get_pyst_dtype(real_t)
+    grid_info = f"{grid_size_y}, {grid_size_x}"
+    # same choice as the "best" instruction set of pystencils
+    supported_instruction_sets = get_supported_instruction_sets()
+    instruction_set = (
+        supported_instruction_sets[-1] if supported_instruction_sets else "avx"
+    )
+    simd_width = get_vector_instruction_set(pyst_dtype, instruction_set)["width"]
+
+    @ps.kernel
+    def _outplane_field_curl_stencil_2d():
+        curl_x, curl_y, field = ps.fields(
+            f"curl_x, curl_y, field : {pyst_dtype}[{grid_info}]"
+        )
+        prefactor = sp.symbols("prefactor")
+        curl_x[0, 0] @= prefactor * (field[1, 0] - field[-1, 0])
+        curl_y[0, 0] @= prefactor * (field[0, -1] - field[0, 1])
+
+    def _gen_outplane_field_curl_kernel_over_slice(iteration_slice, vectorise):
+        # NOTE: OpenMP threading is kept disabled, since each MPI rank already
+        # maps to a core. Explicit SIMD vectorisation is enabled only for kernels
+        # that iterate with unit stride along the innermost (X) axis, over at
+        # least one SIMD vector. Narrower rows get a single full width store
+        # from pystencils, which writes past the iteration slice. The rows
+        # are not padded either, hence the remainder is handled by a scalar loop.
+        kernel_config = get_pyst_kernel_config(
+            real_t=real_t,
+            num_threads=False,
+            iteration_slice=iteration_slice,
+        )
+        num_inner_points = len(range(*iteration_slice[-1].indices(grid_size_x)))
+        if vectorise and num_inner_points >= simd_width:
+            kernel_config = replace(
+                kernel_config,
+                cpu_vectorize_info={
+                    "instruction_set": instruction_set,
+                    "assume_inner_stride_one": True,
+                    "assume_sufficient_line_padding": False,
+                },
+            )
+        return ps.create_kernel(
+            _outplane_field_curl_stencil_2d, config=kernel_config
+        ).compile()
+
+    # NOTE: the interior kernel leaves out a zone of kernel_support thickness
+    # on each side of the domain interior, since that zone needs the ghost
+    # values. The boundary kernels then crunch numbers in that zone after the
+    # ghost comm. is finalised. Since kernel_support is 1, the lower and upper
+    # boundary zone along an axis are a single row/column each, which we cover
+    # in one kernel by striding over the local grid size. The X boundary kernel
+    # skips the corners, which are covered by the Y boundary kernel.
+    y_boundary_stride = max(local_grid_size_y - kernel_support, 1)
+    x_boundary_stride = max(local_grid_size_x - kernel_support, 1)
+    interior_kernel_2d = _gen_outplane_field_curl_kernel_over_slice(
+        ps.make_slice[
+            ghost_size + kernel_support : grid_size_y - ghost_size - kernel_support,
+            ghost_size + kernel_support : grid_size_x - ghost_size - kernel_support,
+        ],
+        vectorise=True,
+    )
+    y_boundary_kernel_2d = _gen_outplane_field_curl_kernel_over_slice(
+        ps.make_slice[
+            ghost_size : grid_size_y - ghost_size : y_boundary_stride,
+            ghost_size : grid_size_x - ghost_size,
+        ],
+        vectorise=True,
+    )
+    x_boundary_kernel_2d = _gen_outplane_field_curl_kernel_over_slice(
+        ps.make_slice[
+            ghost_size + kernel_support : grid_size_y - ghost_size - kernel_support,
+            ghost_size : grid_size_x - ghost_size : x_boundary_stride,
+        ],
+        vectorise=False,
+    )
+    return interior_kernel_2d, y_boundary_kernel_2d, x_boundary_kernel_2d
+
+
 def gen_outplane_field_curl_pyst_mpi_kernel_2d(
     real_t, mpi_construct, ghost_exchange_communicator
 ):
     """MPI-supported 2D outplane field curl kernel generator."""
-    outplane_field_curl_pyst_kernel_2d = gen_outplane_field_curl_pyst_kernel_2d(
-        real_t=real_t, reset_ghost_zone=False
-    )
     kernel_support = 1
     # define this here so that ghost size and kernel support is checked during
     # generation phase itself
@@ -22,6 +119,19 @@ def gen_outplane_field_curl_pyst_mpi_kernel_2d(
         ghost_size=ghost_exchange_communicator.ghost_size,
         kernel_support=gen_outplane_field_curl_pyst_mpi_kernel_2d.kernel_support,
     )
+    ghost_size = ghost_exchange_communicator.ghost_size
+    local_grid_size_y, local_grid_size_x = mpi_construct.local_grid_size
+    (
+        interior_kernel_2d,
+        y_boundary_kernel_2d,
+        x_boundary_kernel_2d,
+    ) = _gen_outplane_field_curl_pyst_kernels_2d(
+        real_t=real_t,
+        local_grid_size_y=int(local_grid_size_y),
+        local_grid_size_x=int(local_grid_size_x),
+        ghost_size=ghost_size,
+        kernel_support=kernel_support,
+    )
 
     # for setting values at physical domain boundary
     y_next, x_next = mpi_construct.next_grid_along
@@ -29,6 +139,10 @@ def gen_outplane_field_curl_pyst_mpi_kernel_2d(
     set_fixed_val_kernel_2d = gen_set_fixed_val_pyst_kernel_2d(
         real_t=real_t, field_type="vector"
     )
+    x_previous_boundary_slice = ps.make_slice[:, :, : ghost_size + 1]
+    x_next_boundary_slice = ps.make_slice[:, :, -ghost_size - 1 :]
+    y_previous_boundary_slice = ps.make_slice[:, : ghost_size + 1, :]
+    y_next_boundary_slice = ps.make_slice[:, -ghost_size - 1 :, :]
 
     def outplane_field_curl_pyst_mpi_kernel_2d(curl, field, prefactor):
         """MPI-supporteed outplane field curl in 2D.
@@ -41,101 +155,44 @@ def gen_outplane_field_curl_pyst_mpi_kernel_2d(
         outplane_field_curl_pyst_mpi_kernel_2d.kernel_support = (
             gen_outplane_field_curl_pyst_mpi_kernel_2d.kernel_support
         )
-        # define variable for use later
-        ghost_size = ghost_exchange_communicator.ghost_size
         # begin ghost comm.
+        # NOTE: only the ghost zone of field is read by the stencil, curl is
+        # write-only here, hence it is the only exchange overlapped with the
+        # interior compute. Consumers of curl ghost values (e.g. advection)
+        # exchange them on their own when needed.
         ghost_exchange_communicator.exchange_scalar_field_init(field)
 
         # crunch interior stencil
-        outplane_field_curl_pyst_kernel_2d(
-            curl=curl[:, ghost_size:-ghost_size, ghost_size:-ghost_size],
-            field=field[ghost_size:-ghost_size, ghost_size:-ghost_size],
-            prefactor=prefactor,
+        interior_kernel_2d(
+            curl_x=curl[0], curl_y=curl[1], field=field, prefactor=prefactor
         )
         # finalise ghost comm.
         ghost_exchange_communicator.exchange_finalise()
 
         # crunch boundary numbers
-        # NOTE: we pass in arrays of width 3 * kernel support size because the
-        # interior stencil computation leaves out a width of kernel_support.
-        # Since the support needed by the kernel is kernel_support on each side,
-        # we need to pass an array of width 3 * kernel_support, starting from
-        # index +/-(ghost_size - kernel_support) on the lower and upper end.
-        # Pystencils then automatically sets the kernel comp. bounds and
-        # crunches numbers in the kernel_support thickness zone at the boundary.
-        # Start of Y axis
-        outplane_field_curl_pyst_kernel_2d(
-            curl=curl[
-                :,
-                ghost_size - kernel_support : ghost_size + 2 * kernel_support,
-                ghost_size:-ghost_size,
-            ],
-            field=field[
-                ghost_size - kernel_support : ghost_size + 2 * kernel_support,
-                ghost_size:-ghost_size,
-            ],
-            prefactor=prefactor,
-        )
-        # End of Y axis
-        outplane_field_curl_pyst_kernel_2d(
-            curl=curl[
-                :,
-                -(ghost_size + 2 * kernel_support) : field.shape[0]
-                - (ghost_size - kernel_support),
-                ghost_size:-ghost_size,
-            ],
-            field=field[
-                -(ghost_size + 2 * kernel_support) : field.shape[0]
-                - (ghost_size - kernel_support),
-                ghost_size:-ghost_size,
-            ],
-            prefactor=prefactor,
-        )
-        # Start of X axis
-        outplane_field_curl_pyst_kernel_2d(
-            curl=curl[
-                :,
-                :,
-                ghost_size - kernel_support : ghost_size + 2 * kernel_support,
-            ],
-            field=field[
-                :,
-                ghost_size - kernel_support : ghost_size + 2 * kernel_support,
-            ],
-            prefactor=prefactor,
+        y_boundary_kernel_2d(
+            curl_x=curl[0], curl_y=curl[1], field=field, prefactor=prefactor
         )
-        # End of X axis
-        outplane_field_curl_pyst_kernel_2d(
-            curl=curl[
-                :,
-                :,
-                -(ghost_size + 2 * kernel_support) : field.shape[1]
-                - (ghost_size - kernel_support),
-            ],
-            field=field[
-                :,
-                -(ghost_size + 2 * kernel_support) : field.shape[1]
-                - (ghost_size - kernel_support),
-            ],
-            prefactor=prefactor,
+        x_boundary_kernel_2d(
+            curl_x=curl[0], curl_y=curl[1], field=field, prefactor=prefactor
         )
 
         # Set physical domain boundary curl to zero based on neighboring block
         if x_previous == MPI.PROC_NULL:
             set_fixed_val_kernel_2d(
-                vector_field=curl[:, :, : ghost_size + 1], fixed_vals=[0.0, 0.0]
+                vector_field=curl[x_previous_boundary_slice], fixed_vals=[0.0, 0.0]
             )
         if x_next == MPI.PROC_NULL:
             set_fixed_val_kernel_2d(
-                vector_field=curl[:, :, -ghost_size - 1 :], fixed_vals=[0.0, 0.0]
+                vector_field=curl[x_next_boundary_slice], fixed_vals=[0.0, 0.0]
             )
         if y_previous == MPI.PROC_NULL:
             set_fixed_val_kernel_2d(
-                vector_field=curl[:, : ghost_size + 1, :], fixed_vals=[0.0, 0.0]
+                vector_field=curl[y_previous_boundary_slice], fixed_vals=[0.0, 0.0]
             )
         if y_next == MPI.PROC_NULL:
             set_fixed_val_kernel_2d(
-                vector_field=curl[:, -ghost_size - 1 :, :], fixed_vals=[0.0, 0.0]
+                vector_field=curl[y_next_boundary_slice], fixed_vals=[0.0, 0.0]
             )
 
     return outplane_field_curl_pyst_mpi_kernel_2d
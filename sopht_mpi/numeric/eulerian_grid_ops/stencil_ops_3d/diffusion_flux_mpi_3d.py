@@ -1,4 +1,5 @@
 """MPI-supported kernels for computing diffusion flux in 3D."""
+from functools import lru_cache
 from sopht.numeric.eulerian_grid_ops.stencil_ops_3d import (
     gen_diffusion_flux_pyst_kernel_3d,
     gen_set_fixed_val_pyst_kernel_3d,
@@ -7,6 +8,21 @@ from sopht_mpi.utils.mpi_utils import check_valid_ghost_size_and_kernel_support
 from mpi4py import MPI
 
 
+@lru_cache(maxsize=None)
+def _gen_diffusion_flux_pyst_kernels_3d(real_t):
+    """Generates the serial 3D diffusion flux and fixed value kernels.
+
+    The kernels only depend on precision, hence they are cached, so that MPI
+    kernels generated for different constructs or ghost communicators reuse
+    the compiled pystencils kernels.
+    """
+    diffusion_flux_pyst_kernel = gen_diffusion_flux_pyst_kernel_3d(
+        real_t=real_t, reset_ghost_zone=False
+    )
+    set_fixed_val_kernel_3d = gen_set_fixed_val_pyst_kernel_3d(real_t=real_t)
+    return diffusion_flux_pyst_kernel, set_fixed_val_kernel_3d
+
+
 def gen_diffusion_flux_pyst_mpi_kernel_3d(
     real_t, mpi_construct, ghost_exchange_communicator, field_type="scalar"
 ):
@@ -15,9 +31,10 @@ def gen_diffusion_flux_pyst_mpi_kernel_3d(
     # Note currently I'm generating these for arbit size arrays, we can optimise this
     # more by generating fixed size for the interior stencil and arbit size for
     # boundary crunching
-    diffusion_flux_pyst_kernel = gen_diffusion_flux_pyst_kernel_3d(
-        real_t=real_t, reset_ghost_zone=False
-    )
+    (
+        diffusion_flux_pyst_kernel,
+        set_fixed_val_kernel_3d,
+    ) = _gen_diffusion_flux_pyst_kernels_3d(real_t=real_t)
     kernel_support = 1
     # define this here so that ghost size and kernel support is checked during
     # generation phase itself
@@ -30,23 +47,10 @@ def gen_diffusion_flux_pyst_mpi_kernel_3d(
     # for setting values at physical domain boundary
     z_next, y_next, x_next = mpi_construct.next_grid_along
     z_previous, y_previous, x_previous = mpi_construct.previous_grid_along
-    set_fixed_val_kernel_3d = gen_set_fixed_val_pyst_kernel_3d(real_t=real_t)
 
-    def diffusion_flux_pyst_mpi_kernel_3d(
-        diffusion_flux,
-        field,
-        prefactor,
-    ):
-        # define kernel support for kernel
-        diffusion_flux_pyst_mpi_kernel_3d.kernel_support = (
-            gen_diffusion_flux_pyst_mpi_kernel_3d.kernel_support
-        )
-        # define variable for use later
+    def diffusion_flux_interior_pyst_kernel_3d(diffusion_flux, field, prefactor):
+        """Diffusion flux on the interior, which needs no ghost data."""
         ghost_size = ghost_exchange_communicator.ghost_size
-        # begin ghost comm.
-        ghost_exchange_communicator.exchange_scalar_field_init(field)
-
-        # crunch interior stencil
         diffusion_flux_pyst_kernel(
             diffusion_flux=diffusion_flux[
                 ghost_size:-ghost_size, ghost_size:-ghost_size, ghost_size:-ghost_size
@@ -56,9 +60,10 @@ def gen_diffusion_flux_pyst_mpi_kernel_3d(
             ],
             prefactor=prefactor,
         )
-        # finalise ghost comm.
-        ghost_exchange_communicator.exchange_finalise()
 
+    def diffusion_flux_boundary_pyst_kernel_3d(diffusion_flux, field, prefactor):
+        """Diffusion flux near the local block boundary, after ghost exchange."""
+        ghost_size = ghost_exchange_communicator.ghost_size
         # crunch boundary numbers
         # NOTE: we pass in arrays of width 3 * kernel support size because the
         # interior stencil computation leaves out a width of kernel_support.
@@ -191,6 +196,28 @@ def gen_diffusion_flux_pyst_mpi_kernel_3d(
                 fixed_val=0.0,
             )
 
+    def diffusion_flux_pyst_mpi_kernel_3d(
+        diffusion_flux,
+        field,
+        prefactor,
+    ):
+        # define kernel support for kernel
+        diffusion_flux_pyst_mpi_kernel_3d.kernel_support = (
+            gen_diffusion_flux_pyst_mpi_kernel_3d.kernel_support
+        )
+        # begin ghost comm.
+        ghost_exchange_communicator.exchange_scalar_field_init(field)
+        # crunch interior stencil
+        diffusion_flux_interior_pyst_kernel_3d(
+            diffusion_flux=diffusion_flux, field=field, prefactor=prefactor
+        )
+        # finalise ghost comm.
+        ghost_exchange_communicator.exchange_finalise()
+        # crunch boundary numbers
+        diffusion_flux_boundary_pyst_kernel_3d(
+            diffusion_flux=diffusion_flux, field=field, prefactor=prefactor
+        )
+
     if field_type == "scalar":
         return diffusion_flux_pyst_mpi_kernel_3d
     elif field_type == "vector":
@@ -208,21 +235,20 @@ def gen_diffusion_flux_pyst_mpi_kernel_3d(
             vector_field_diffusion_flux_pyst_mpi_kernel_3d.kernel_support = (
                 gen_diffusion_flux_pyst_mpi_kernel_3d.kernel_support
             )
-
-            diffusion_flux_pyst_mpi_kernel_3d(
-                diffusion_flux=vector_field_diffusion_flux[0],
-                field=vector_field[0],
-                prefactor=prefactor,
-            )
-            diffusion_flux_pyst_mpi_kernel_3d(
-                diffusion_flux=vector_field_diffusion_flux[1],
-                field=vector_field[1],
-                prefactor=prefactor,
-            )
-            diffusion_flux_pyst_mpi_kernel_3d(
-                diffusion_flux=vector_field_diffusion_flux[2],
-                field=vector_field[2],
-                prefactor=prefactor,
-            )
+            # begin ghost comm. for all components at once, so that the three
+            # components share a single exchange instead of one each
+            ghost_exchange_communicator.exchange_vector_field_init(vector_field)
+            # crunch interior stencil
+            for diffusion_flux, field in zip(vector_field_diffusion_flux, vector_field):
+                diffusion_flux_interior_pyst_kernel_3d(
+                    diffusion_flux=diffusion_flux, field=field, prefactor=prefactor
+                )
+            # finalise ghost comm.
+            ghost_exchange_communicator.exchange_finalise()
+            # crunch boundary numbers
+            for diffusion_flux, field in zip(vector_field_diffusion_flux, vector_field):
+                diffusion_flux_boundary_pyst_kernel_3d(
+                    diffusion_flux=diffusion_flux, field=field, prefactor=prefactor
+                )
 
         return vector_field_diffusion_flux_pyst_mpi_kernel_3d
@@ -317,10 +317,12 @@ class MPIIO:
                             shape=(1, *self.eulerian_grid_size),
                             dtype=self.real_dtype,
                         )
-                        # Write the local chunk of data
-                        dset[self.local_eulerian_index] = field[
-                            self.eulerian_field_inner_index
-                        ].reshape(1, *self.local_eulerian_grid_size)
+                        # Write the local chunk of data (collectively, since all
+                        # ranks write their chunk into the dataset)
+                        with dset.collective:
+                            dset[self.local_eulerian_index] = field[
+                                self.eulerian_field_inner_index
+                            ].reshape(1, *self.local_eulerian_grid_size)
                     elif field_type == "Vector":
                         # Decompose vector fields into individual component as scalar fields
                         for idx_dim in range(self.dim):
@@ -330,10 +332,11 @@ class MPIIO:
                                 shape=(1, *self.eulerian_grid_size),
                                 dtype=self.real_dtype,
                             )
-                            # Write the local chunk of data
-                            dset[self.local_eulerian_index] = field[idx_dim][
-                                self.eulerian_field_inner_index
-                            ].reshape(1, *self.local_eulerian_grid_size)
+                            # Write the local chunk of data (collectively)
+                            with dset.collective:
+                                dset[self.local_eulerian_index] = field[idx_dim][
+                                    self.eulerian_field_inner_index
+                                ].reshape(1, *self.local_eulerian_grid_size)
                     else:
                         raise ValueError(
                             "Unsupported eulerian_field_type ('Scalar' and 'Vector' only)"
@@ -457,11 +460,12 @@ class MPIIO:
                         assert (
                             f"Eulerian/{field_type}/{field_name}" in keys
                         ), f"Unable to find scalar field {field_name} in loaded file!"
-                        self.eulerian_fields[field_name][
-                            self.eulerian_field_inner_index
-                        ] = f["Eulerian"][field_type][field_name][
-                            self.local_eulerian_index
-                        ]
+                        # Read the local chunk of data (collectively)
+                        dset = f["Eulerian"][field_type][field_name]
+                        with dset.collective:
+                            self.eulerian_fields[field_name][
+                                self.eulerian_field_inner_index
+                            ] = dset[self.local_eulerian_index]
                     elif field_type == "Vector":
                         for idx_dim in range(self.dim):
                             assert (
@@ -470,11 +474,12 @@ class MPIIO:
                                 f"Unable to find vector field {field_name}_{idx_dim} "
                                 f"in loaded file!"
                             )
-                            self.eulerian_fields[field_name][idx_dim][
-                                self.eulerian_field_inner_index
-                            ] = f["Eulerian"][field_type][f"{field_name}_{idx_dim}"][
-                                self.local_eulerian_index
-                            ]
+                            # Read the local chunk of data (collectively)
+                            dset = f["Eulerian"][field_type][f"{field_name}_{idx_dim}"]
+                            with dset.collective:
+                                self.eulerian_fields[field_name][idx_dim][
+                                    self.eulerian_field_inner_index
+                                ] = dset[self.local_eulerian_index]
                     else:
                         raise ValueError(
                             "Unsupported lagrangian_field_type ('Scalar' and 'Vector' only)"
@@ -137,8 +137,14 @@ class MPIGhostCommunicator2D:
 
         if self.full_exchange:
             self.exchange_scalar_field_init = self.exchange_scalar_field_full_init
+            self._exchange_contiguous_vector_field_init = (
+                self.exchange_vector_field_full_init
+            )
         else:
             self.exchange_scalar_field_init = self.exchange_scalar_field_edges_init
+            self._exchange_contiguous_vector_field_init = (
+                self.exchange_vector_field_edges_init
+            )
 
     def init_datatypes(self):
         """
@@ -174,6 +180,29 @@ class MPIGhostCommunicator2D:
             )
             self.corner_type.Commit()
 
+        # (4) For vector field data
+        # Stacks the above datatypes for all components of a (contiguous) vector
+        # field, so that all components are exchanged in a single message.
+        component_stride = (
+            np.prod(self.field_size + 2 * self.ghost_size)
+            * self.mpi_construct.dtype_generator.Get_size()
+        )
+        self.vector_row_type = self.row_type.Create_hvector(
+            count=self.mpi_construct.grid_dim, blocklength=1, stride=component_stride
+        )
+        self.vector_row_type.Commit()
+        self.vector_column_type = self.column_type.Create_hvector(
+            count=self.mpi_construct.grid_dim, blocklength=1, stride=component_stride
+        )
+        self.vector_column_type.Commit()
+        if self.full_exchange:
+            self.vector_corner_type = self.corner_type.Create_hvector(
+                count=self.mpi_construct.grid_dim,
+                blocklength=1,
+                stride=component_stride,
+            )
+            self.vector_corner_type.Commit()
+
     def _get_diagonally_shifted_coord_rank(self, coord_shift):
         """Helper function to get diagonally shifted coords"""
         shifted_coord = self.grid_coord + np.array(coord_shift)
@@ -188,22 +217,28 @@ class MPIGhostCommunicator2D:
             rank = self.mpi_construct.grid.Get_cart_rank(shifted_coord)
         return rank
 
-    def exchange_scalar_field_edges_init(self, local_field):
+    def _exchange_field_edges_init(self, local_field, row_type, column_type):
         """
-        Exchange scalar field ghost data on edges (sides) between neighbors.
+        Exchange field ghost data on edges (sides) between neighbors.
+
+        Offsets below are with respect to the start of the (first component of the)
+        field, so that the same offsets apply to both scalar and vector fields.
         """
         # Lines below to make code more literal
         y_axis = 0
         x_axis = 1
-        ghost_rows_offset = self.ghost_size * local_field.shape[1]
+        field_size_y, field_size_x = local_field.shape[-2:]
+        ghost_rows_offset = self.ghost_size * field_size_x
+        field_offset = field_size_y * field_size_x
+        local_field_buffer = local_field.ravel()
 
         # Along Y: send to previous block, receive from next block
         self.comm_requests.append(
             self.mpi_construct.grid.Isend(
                 (
-                    local_field.ravel()[ghost_rows_offset + self.ghost_size :],
+                    local_field_buffer[ghost_rows_offset + self.ghost_size :],
                     1,
-                    self.row_type,
+                    row_type,
                 ),
                 dest=self.mpi_construct.previous_grid_along[y_axis],
             )
@@ -211,9 +246,11 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Irecv(
                 (
-                    local_field.ravel()[-ghost_rows_offset + self.ghost_size :],
+                    local_field_buffer[
+                        field_offset - ghost_rows_offset + self.ghost_size :
+                    ],
                     1,
-                    self.row_type,
+                    row_type,
                 ),
                 source=self.mpi_construct.next_grid_along[y_axis],
             )
@@ -223,9 +260,11 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Isend(
                 (
-                    local_field.ravel()[-2 * ghost_rows_offset + self.ghost_size :],
+                    local_field_buffer[
+                        field_offset - 2 * ghost_rows_offset + self.ghost_size :
+                    ],
                     1,
-                    self.row_type,
+                    row_type,
                 ),
                 dest=self.mpi_construct.next_grid_along[y_axis],
             )
@@ -233,9 +272,9 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Irecv(
                 (
-                    local_field.ravel()[self.ghost_size :],
+                    local_field_buffer[self.ghost_size :],
                     1,
-                    self.row_type,
+                    row_type,
                 ),
                 source=self.mpi_construct.previous_grid_along[y_axis],
             )
@@ -245,9 +284,9 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Isend(
                 (
-                    local_field.ravel()[ghost_rows_offset + self.ghost_size :],
+                    local_field_buffer[ghost_rows_offset + self.ghost_size :],
                     1,
-                    self.column_type,
+                    column_type,
                 ),
                 dest=self.mpi_construct.previous_grid_along[x_axis],
             )
@@ -255,11 +294,11 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Irecv(
                 (
-                    local_field.ravel()[
-                        ghost_rows_offset + local_field.shape[1] - self.ghost_size :
+                    local_field_buffer[
+                        ghost_rows_offset + field_size_x - self.ghost_size :
                     ],
                     1,
-                    self.column_type,
+                    column_type,
                 ),
                 source=self.mpi_construct.next_grid_along[x_axis],
             )
@@ -269,11 +308,11 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Isend(
                 (
-                    local_field.ravel()[
-                        ghost_rows_offset + local_field.shape[1] - 2 * self.ghost_size :
+                    local_field_buffer[
+                        ghost_rows_offset + field_size_x - 2 * self.ghost_size :
                     ],
                     1,
-                    self.column_type,
+                    column_type,
                 ),
                 dest=self.mpi_construct.next_grid_along[x_axis],
             )
@@ -281,19 +320,25 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Irecv(
                 (
-                    local_field.ravel()[ghost_rows_offset:],
+                    local_field_buffer[ghost_rows_offset:],
                     1,
-                    self.column_type,
+                    column_type,
                 ),
                 source=self.mpi_construct.previous_grid_along[x_axis],
             )
         )
 
-    def exchange_scalar_field_vertices_init(self, local_field):
+    def _exchange_field_vertices_init(self, local_field, corner_type):
         """
-        Exchange scalar field ghost data on vertices (corners) between neighbors.
+        Exchange field ghost data on vertices (corners) between neighbors.
+
+        Offsets below are with respect to the start of the (first component of the)
+        field, so that the same offsets apply to both scalar and vector fields.
         """
-        ghost_rows_offset = self.ghost_size * local_field.shape[1]
+        field_size_y, field_size_x = local_field.shape[-2:]
+        ghost_rows_offset = self.ghost_size * field_size_x
+        field_offset = field_size_y * field_size_x
+        local_field_buffer = local_field.ravel()
         # Exchange corner ghost cells (four corners, so 4 exchanges here)
         # (1) Update top right corner
         # send bottom left corner to corresponding diagonal block (-1, -1),
@@ -301,9 +346,9 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Isend(
                 (
-                    local_field.ravel()[ghost_rows_offset + self.ghost_size :],
+                    local_field_buffer[ghost_rows_offset + self.ghost_size :],
                     1,
-                    self.corner_type,
+                    corner_type,
                 ),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, -1]),
             )
@@ -311,12 +356,13 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Irecv(
                 (
-                    local_field.ravel()[
-                        -(self.ghost_size - 1) * local_field.shape[1]
+                    local_field_buffer[
+                        field_offset
+                        - (self.ghost_size - 1) * field_size_x
                         - self.ghost_size :
                     ],
                     1,
-                    self.corner_type,
+                    corner_type,
                 ),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 1]),
             )
@@ -327,12 +373,13 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Isend(
                 (
-                    local_field.ravel()[
-                        -(2 * self.ghost_size - 1) * local_field.shape[1]
+                    local_field_buffer[
+                        field_offset
+                        - (2 * self.ghost_size - 1) * field_size_x
                         - 2 * self.ghost_size :
                     ],
                     1,
-                    self.corner_type,
+                    corner_type,
                 ),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 1]),
             )
@@ -340,9 +387,9 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Irecv(
                 (
-                    local_field.ravel()[0:],
+                    local_field_buffer[0:],
                     1,
-                    self.corner_type,
+                    corner_type,
                 ),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, -1]),
             )
@@ -353,11 +400,11 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Isend(
                 (
-                    local_field.ravel()[
-                        ghost_rows_offset + local_field.shape[1] - 2 * self.ghost_size :
+                    local_field_buffer[
+                        ghost_rows_offset + field_size_x - 2 * self.ghost_size :
                     ],
                     1,
-                    self.corner_type,
+                    corner_type,
                 ),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 1]),
             )
@@ -365,9 +412,9 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Irecv(
                 (
-                    local_field.ravel()[-ghost_rows_offset:],
+                    local_field_buffer[field_offset - ghost_rows_offset :],
                     1,
-                    self.corner_type,
+                    corner_type,
                 ),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, -1]),
             )
@@ -378,9 +425,11 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Isend(
                 (
-                    local_field.ravel()[-2 * ghost_rows_offset + self.ghost_size :],
+                    local_field_buffer[
+                        field_offset - 2 * ghost_rows_offset + self.ghost_size :
+                    ],
                     1,
-                    self.corner_type,
+                    corner_type,
                 ),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, -1]),
             )
@@ -388,14 +437,28 @@ class MPIGhostCommunicator2D:
         self.comm_requests.append(
             self.mpi_construct.grid.Irecv(
                 (
-                    local_field.ravel()[local_field.shape[1] - self.ghost_size :],
+                    local_field_buffer[field_size_x - self.ghost_size :],
                     1,
-                    self.corner_type,
+                    corner_type,
                 ),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 1]),
             )
         )
 
+    def exchange_scalar_field_edges_init(self, local_field):
+        """
+        Exchange scalar field ghost data on edges (sides) between neighbors.
+        """
+        self._exchange_field_edges_init(
+            local_field, row_type=self.row_type, column_type=self.column_type
+        )
+
+    def exchange_scalar_field_vertices_init(self, local_field):
+        """
+        Exchange scalar field ghost data on vertices (corners) between neighbors.
+        """
+        self._exchange_field_vertices_init(local_field, corner_type=self.corner_type)
+
     def exchange_scalar_field_full_init(self, local_field):
         """
         Exchange scalar field ghost data (a full halo ring) between neighbors.
@@ -403,14 +466,51 @@ class MPIGhostCommunicator2D:
         self.exchange_scalar_field_edges_init(local_field)
         self.exchange_scalar_field_vertices_init(local_field)
 
-    def exchange_vector_field_init(self, local_vector_field):
-        self.exchange_scalar_field_init(
-            local_field=local_vector_field[VectorField.x_axis_idx()]
+    def exchange_vector_field_edges_init(self, local_vector_field):
+        """
+        Exchange (contiguous) vector field ghost data on edges (sides) between
+        neighbors, with all components in a single message per neighbor.
+        """
+        self._exchange_field_edges_init(
+            local_vector_field,
+            row_type=self.vector_row_type,
+            column_type=self.vector_column_type,
         )
-        self.exchange_scalar_field_init(
-            local_field=local_vector_field[VectorField.y_axis_idx()]
+
+    def exchange_vector_field_vertices_init(self, local_vector_field):
+        """
+        Exchange (contiguous) vector field ghost data on vertices (corners) between
+        neighbors, with all components in a single message per neighbor.
+        """
+        self._exchange_field_vertices_init(
+            local_vector_field, corner_type=self.vector_corner_type
         )
 
+    def exchange_vector_field_full_init(self, local_vector_field):
+        """
+        Exchange (contiguous) vector field ghost data (a full halo ring) between
+        neighbors, with all components in a single message per neighbor.
+        """
+        self.exchange_vector_field_edges_init(local_vector_field)
+        self.exchange_vector_field_vertices_init(local_vector_field)
+
+    def exchange_vector_field_init(self, local_vector_field):
+        """
+        Exchange vector field ghost data between neighbors.
+
+        All components are exchanged together if the vector field is contiguous,
+        otherwise we fall back to exchanging the components one by one.
+        """
+        if local_vector_field.flags.c_contiguous:
+            self._exchange_contiguous_vector_field_init(local_vector_field)
+        else:
+            self.exchange_scalar_field_init(
+                local_field=local_vector_field[VectorField.x_axis_idx()]
+            )
+            self.exchange_scalar_field_init(
+                local_field=local_vector_field[VectorField.y_axis_idx()]
+            )
+
     def exchange_finalise(self):
         """
         Finalizing non-blocking exchange ghost data between neighbors.
@@ -441,15 +541,22 @@ class MPIFieldCommunicator2D:
         self.mpi_construct = mpi_construct
         if self.ghost_size == 0:
             self.inner_idx = ...
+            self._field_inner_idx = ...
         else:
             self.inner_idx = (
                 slice(self.ghost_size, -self.ghost_size),
             ) * mpi_construct.grid_dim
+            # leading ellipsis to index both scalar and vector fields
+            self._field_inner_idx = (..., *self.inner_idx)
         # Datatypes for subdomain used in gather and scatter
         field_sub_size = mpi_construct.local_grid_size
         # master rank uses datatype for receiving sub arrays in full array
         self.master_rank = master_rank
-        self.slave_ranks = set(np.arange(mpi_construct.size)) - set([self.master_rank])
+        self.slave_ranks = tuple(
+            rank_idx
+            for rank_idx in range(mpi_construct.size)
+            if rank_idx != self.master_rank
+        )
         if mpi_construct.rank == self.master_rank:
             field_size = mpi_construct.global_grid_size
             self.sub_array_type = mpi_construct.dtype_generator.Create_subarray(
@@ -457,6 +564,28 @@ class MPIFieldCommunicator2D:
                 subsizes=field_sub_size,
                 starts=[0] * mpi_construct.grid_dim,
             )
+            # Location of the local chunk of each rank in the global field, i.e.
+            # chunk indices for the master rank itself and flat offsets of the sub
+            # arrays for other ranks
+            chunk_start = (
+                np.array(mpi_construct.grid.Get_coords(self.master_rank))
+                * field_sub_size
+            )
+            self.local_chunk_idx = (...,) + tuple(
+                slice(start, start + size)
+                for start, size in zip(chunk_start, field_sub_size)
+            )
+            self.slave_rank_offsets = [
+                (
+                    rank_idx,
+                    np.ravel_multi_index(
+                        np.array(mpi_construct.grid.Get_coords(rank_idx))
+                        * field_sub_size,
+                        field_size,
+                    ),
+                )
+                for rank_idx in self.slave_ranks
+            ]
         # Other ranks use datatype for sending sub arrays
         else:
             field_size = mpi_construct.local_grid_size + 2 * self.ghost_size
@@ -466,106 +595,122 @@ class MPIFieldCommunicator2D:
                 starts=[self.ghost_size] * mpi_construct.grid_dim,
             )
         self.sub_array_type.Commit()
+        # Stacks the above datatype for all components of a (contiguous) vector
+        # field, so that all components are communicated in a single message
+        self.vector_sub_array_type = self.sub_array_type.Create_hvector(
+            count=mpi_construct.grid_dim,
+            blocklength=1,
+            stride=np.prod(field_size) * mpi_construct.dtype_generator.Get_size(),
+        )
+        self.vector_sub_array_type.Commit()
 
-    def gather_local_scalar_field(self, global_field, local_field):
+    def _gather_local_field(self, global_field, local_field, sub_array_type):
         """
-        Gather local scalar fields from all ranks and return a global scalar field in
-        master rank
+        Gather local (scalar or vector) fields from all ranks into a global field in
+        master rank, using the sub array datatype `sub_array_type`
         """
         if self.mpi_construct.rank == self.master_rank:
             # Fill in field values for master rank
-            coords = self.mpi_construct.grid.Get_coords(self.master_rank)
-            local_chunk_idx = (
-                slice(
-                    coords[0] * self.mpi_construct.local_grid_size[0],
-                    (coords[0] + 1) * self.mpi_construct.local_grid_size[0],
-                ),
-                slice(
-                    coords[1] * self.mpi_construct.local_grid_size[1],
-                    (coords[1] + 1) * self.mpi_construct.local_grid_size[1],
-                ),
-            )
-            global_field[local_chunk_idx] = local_field[self.inner_idx]
-            # Receiving from other ranks as contiguous array
-            for rank_idx in self.slave_ranks:
-                coords = self.mpi_construct.grid.Get_coords(rank_idx)
-                idx = np.ravel_multi_index(
-                    coords * self.mpi_construct.local_grid_size,
-                    self.mpi_construct.global_grid_size,
-                )
-                self.mpi_construct.grid.Recv(
-                    (global_field.ravel()[idx:], 1, self.sub_array_type),
+            global_field[self.local_chunk_idx] = local_field[self._field_inner_idx]
+            global_field_buffer = global_field.ravel()
+            # Receiving from other ranks as contiguous array (non-blocking, so that
+            # all transfers are in flight together)
+            comm_requests = [
+                self.mpi_construct.grid.Irecv(
+                    (global_field_buffer[offset:], 1, sub_array_type),
                     source=rank_idx,
                 )
+                for rank_idx, offset in self.slave_rank_offsets
+            ]
+            MPI.Request.Waitall(comm_requests)
         else:
             # Sending as contiguous chunks
             self.mpi_construct.grid.Send(
-                (local_field, 1, self.sub_array_type), dest=self.master_rank
+                (local_field, 1, sub_array_type), dest=self.master_rank
             )
 
+    def gather_local_scalar_field(self, global_field, local_field):
+        """
+        Gather local scalar fields from all ranks and return a global scalar field in
+        master rank
+        """
+        self._gather_local_field(global_field, local_field, self.sub_array_type)
+
     def gather_local_vector_field(self, global_vector_field, local_vector_field):
         """
         Gather local vector fields from all ranks and return a global vector field in
         master rank
+
+        All components are gathered together if the vector field is contiguous,
+        otherwise we fall back to gathering the components one by one.
         """
-        self.gather_local_scalar_field(
-            global_field=global_vector_field[VectorField.x_axis_idx()],
-            local_field=local_vector_field[VectorField.x_axis_idx()],
-        )
-        self.gather_local_scalar_field(
-            global_field=global_vector_field[VectorField.y_axis_idx()],
-            local_field=local_vector_field[VectorField.y_axis_idx()],
-        )
+        if local_vector_field.flags.c_contiguous:
+            self._gather_local_field(
+                global_vector_field, local_vector_field, self.vector_sub_array_type
+            )
+        else:
+            self.gather_local_scalar_field(
+                global_field=global_vector_field[VectorField.x_axis_idx()],
+                local_field=local_vector_field[VectorField.x_axis_idx()],
+            )
+            self.gather_local_scalar_field(
+                global_field=global_vector_field[VectorField.y_axis_idx()],
+                local_field=local_vector_field[VectorField.y_axis_idx()],
+            )
 
-    def scatter_global_scalar_field(self, local_field, global_field):
+    def _scatter_global_field(self, local_field, global_field, sub_array_type):
         """
-        Scatter a global scalar field in master rank into local scalar fields in each
-        corresponding ranks
+        Scatter a global (scalar or vector) field in master rank into local fields in
+        each corresponding ranks, using the sub array datatype `sub_array_type`
         """
         # Fill in field values for master rank on the edge
         if self.mpi_construct.rank == self.master_rank:
-            coords = self.mpi_construct.grid.Get_coords(self.master_rank)
-            local_chunk_idx = (
-                slice(
-                    coords[0] * self.mpi_construct.local_grid_size[0],
-                    (coords[0] + 1) * self.mpi_construct.local_grid_size[0],
-                ),
-                slice(
-                    coords[1] * self.mpi_construct.local_grid_size[1],
-                    (coords[1] + 1) * self.mpi_construct.local_grid_size[1],
-                ),
-            )
-            local_field[self.inner_idx] = global_field[local_chunk_idx]
-            # Sending to other ranks as contiguous array
-            for rank_idx in self.slave_ranks:
-                coords = self.mpi_construct.grid.Get_coords(rank_idx)
-                idx = np.ravel_multi_index(
-                    coords * self.mpi_construct.local_grid_size,
-                    self.mpi_construct.global_grid_size,
-                )
-                self.mpi_construct.grid.Send(
-                    (global_field.ravel()[idx:], 1, self.sub_array_type),
+            local_field[self._field_inner_idx] = global_field[self.local_chunk_idx]
+            global_field_buffer = global_field.ravel()
+            # Sending to other ranks as contiguous array (non-blocking, so that
+            # all transfers are in flight together)
+            comm_requests = [
+                self.mpi_construct.grid.Isend(
+                    (global_field_buffer[offset:], 1, sub_array_type),
                     dest=rank_idx,
                 )
+                for rank_idx, offset in self.slave_rank_offsets
+            ]
+            MPI.Request.Waitall(comm_requests)
         else:
             # Receiving from master_rank as contiguous array
             self.mpi_construct.grid.Recv(
-                (local_field, 1, self.sub_array_type), source=self.master_rank
+                (local_field, 1, sub_array_type), source=self.master_rank
             )
 
+    def scatter_global_scalar_field(self, local_field, global_field):
+        """
+        Scatter a global scalar field in master rank into local scalar fields in each
+        corresponding ranks
+        """
+        self._scatter_global_field(local_field, global_field, self.sub_array_type)
+
     def scatter_global_vector_field(self, local_vector_field, global_vector_field):
         """
         Scatter a global vector field in master rank into local vector fields in each
         corresponding ranks
+
+        All components are scattered together if the vector field is contiguous,
+        otherwise we fall back to scattering the components one by one.
         """
-        self.scatter_global_scalar_field(
-            local_field=local_vector_field[VectorField.x_axis_idx()],
-            global_field=global_vector_field[VectorField.x_axis_idx()],
-        )
-        self.scatter_global_scalar_field(
-            local_field=local_vector_field[VectorField.y_axis_idx()],
-            global_field=global_vector_field[VectorField.y_axis_idx()],
-        )
+        if local_vector_field.flags.c_contiguous:
+            self._scatter_global_field(
+                local_vector_field, global_vector_field, self.vector_sub_array_type
+            )
+        else:
+            self.scatter_global_scalar_field(
+                local_field=local_vector_field[VectorField.x_axis_idx()],
+                global_field=global_vector_field[VectorField.x_axis_idx()],
+            )
+            self.scatter_global_scalar_field(
+                local_field=local_vector_field[VectorField.y_axis_idx()],
+                global_field=global_vector_field[VectorField.y_axis_idx()],
+            )
 
 
 class MPILagrangianFieldCommunicator2D:
@@ -748,6 +893,7 @@ class MPIPlotter2D:
         )
         self.x_grid_io = np.zeros_like(self.field_io)
         self.y_grid_io = np.zeros_like(self.field_io)
+        self.cbar = None
 
         # Initialize figure
         self.create_figure_and_axes(fig_aspect_ratio, title=title)
@@ -787,16 +933,20 @@ class MPIPlotter2D:
         """
         Plot contour fields.
 
-        Note: this runs on every rank, but since we gather the field to master rank,
-        only master rank contains useful information. This will be saved later when
-        `save_and_clear_fig(...)` is called, which runs only on master_rank. The
-        plotting here is done on all rank since they have to wait for master_rank
-        anyway, and gather field needs to be called on all rank otherwise we run
-        into deadlock situations.
+        Note: the gather of the fields to master rank needs to be called on all
+        ranks, otherwise we run into deadlock situations. The actual plotting is
+        only done on master rank, since only master rank contains useful
+        information, which will be saved later when `savefig(...)` is called.
+        This way the other ranks skip the rendering and proceed with their work.
         """
         self.gather_local_scalar_field(self.field_io, field)
         self.gather_local_scalar_field(self.x_grid_io, x_grid)
         self.gather_local_scalar_field(self.y_grid_io, y_grid)
+        self._contourf_on_master(levels, cmap, *args, **kwargs)
+
+    @execute_only_on_master
+    def _contourf_on_master(self, levels, cmap, *args, **kwargs):
+        """Plot gathered contour fields (only on master)."""
         contourf_obj = self.ax.contourf(
             self.x_grid_io,
             self.y_grid_io,
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from mpi4py import MPI
 import numpy as np
 from sopht_mpi.utils.mpi_logger import logger
@@ -113,9 +114,36 @@ class MPIGhostCommunicator3D:
     decomposition mode is pencils (in 3D, mpi4py-fft allows for both slabs and pencils),
     full exchange is needed if the structured-to-unstructured grid interpolation is
     performed.
+
+    `pack_faces` exchanges the (largest) face ghost data through contiguous buffers,
+    packed and unpacked with numpy, instead of the subarray datatypes. This avoids
+    relying on the MPI library for handling the strided layouts, which can be slow
+    for some MPI implementations.
+
+    `comm_dtype` (defaults to `real_t` of the MPI construct) sets the precision of
+    the packed face buffers, e.g. `np.float32` for a `np.float64` simulation halves
+    the bytes exchanged on faces, and implies `pack_faces`. The face ghost values
+    are then only single precision accurate, which also limits the accuracy of
+    stencils computed near the subdomain boundaries (amplified by 1 / dx^k for a
+    k-th derivative), so this should only be used when that error stays well below
+    the discretisation error.
+
+    `persistent_requests_cache_size` bounds the number of fields for which
+    persistent requests (and packing buffers) are kept. A simulator exchanges a
+    fixed set of fields, which should fit in the cache. Beyond that, the least
+    recently exchanged field's requests are freed, and are created again if the
+    field is exchanged later. `free_persistent_requests` frees all of them.
     """
 
-    def __init__(self, ghost_size, mpi_construct, full_exchange=True):
+    def __init__(
+        self,
+        ghost_size,
+        mpi_construct,
+        full_exchange=True,
+        pack_faces=False,
+        comm_dtype=None,
+        persistent_requests_cache_size=16,
+    ):
         # extra width needed for kernel computation
         if ghost_size <= 0 and not isinstance(ghost_size, int):
             raise ValueError(
@@ -125,6 +153,10 @@ class MPIGhostCommunicator3D:
         self.ghost_size = ghost_size
         self.mpi_construct = mpi_construct
         self.full_exchange = full_exchange
+        # precision of packed face buffers, reduced precision implies packing
+        self.comm_dtype = mpi_construct.real_t if comm_dtype is None else comm_dtype
+        # exchange faces via contiguous buffers instead of subarray datatypes
+        self.pack_faces = pack_faces or self.comm_dtype != mpi_construct.real_t
         self.grid_coord = np.array(self.mpi_construct.grid.coords)
 
         # Initialize data types
@@ -132,11 +164,31 @@ class MPIGhostCommunicator3D:
 
         # Initialize requests list for non-blocking comm
         self.comm_requests = []
+        # Persistent requests, built lazily once per exchanged field buffer, and
+        # kept for the most recently exchanged fields (in LRU order)
+        self.persistent_requests_cache_size = persistent_requests_cache_size
+        self.persistent_requests = OrderedDict()
+        # keys of the persistent requests with recvs/sends started, but not yet
+        # finalised
+        self.active_recv_keys = set()
+        self.active_send_keys = set()
+        # uncached requests, freed on finalise
+        self.temporary_requests = []
+        # (field, buffer) copies for unpacking recv buffers after exchange
+        self.pending_recv_buffer_copies = []
 
         if self.full_exchange:
             self.exchange_scalar_field_init = self.exchange_scalar_field_full_init
+            self._exchange_contiguous_vector_field_init = (
+                self.exchange_vector_field_full_init
+            )
+            self._init_field_requests = self._init_field_full_requests
         else:
             self.exchange_scalar_field_init = self.exchange_scalar_field_faces_init
+            self._exchange_contiguous_vector_field_init = (
+                self.exchange_vector_field_faces_init
+            )
+            self._init_field_requests = self._init_field_faces_requests
 
     def init_datatypes(self):
         """
@@ -739,6 +791,28 @@ class MPIGhostCommunicator3D:
             )
             self.recv_from_pz_py_px_type.Commit()
 
+        # (4) For vector field data
+        # Stacks each of the above datatypes for all components of a (contiguous)
+        # vector field, so that all components are exchanged in a single message.
+        self.scalar_field_types = {
+            name: datatype
+            for name, datatype in vars(self).items()
+            if name.startswith(("send_to_", "recv_from_"))
+        }
+        component_stride = (
+            np.prod(self.field_size_with_ghost)
+            * self.mpi_construct.dtype_generator.Get_size()
+        )
+        self.vector_field_types = {}
+        for name, scalar_type in self.scalar_field_types.items():
+            vector_type = scalar_type.Create_hvector(
+                count=self.mpi_construct.grid_dim,
+                blocklength=1,
+                stride=component_stride,
+            )
+            vector_type.Commit()
+            self.vector_field_types[name] = vector_type
+
     def _get_diagonally_shifted_coord_rank(self, coord_shift):
         """Helper function to get diagonally shifted coords"""
         shifted_coord = self.grid_coord + np.array(coord_shift)
@@ -753,393 +827,705 @@ class MPIGhostCommunicator3D:
             rank = self.mpi_construct.grid.Get_cart_rank(shifted_coord)
         return rank
 
-    def exchange_scalar_field_faces_init(self, local_field):
+    def _init_field_faces_requests(self, local_field, field_types):
         """
-        Exchange scalar field ghost data on faces between neighbors.
+        Create persistent (recv, send) requests for exchanging field ghost data on
+        faces between neighbors, along with the buffer copies for packing the sends
+        and unpacking the recvs, if any.
+        """
+        if self.pack_faces:
+            return self._init_packed_field_faces_requests(local_field)
+        return self._init_subarray_field_faces_requests(local_field, field_types)
+
+    def _init_packed_field_faces_requests(self, local_field):
+        """
+        Create persistent (recv, send) requests for exchanging field ghost data on
+        faces between neighbors via contiguous buffers, along with the
+        (destination, source) copies for packing the sends and unpacking the recvs.
+        """
+        recv_requests = []
+        send_requests = []
+        send_buffer_copies = []
+        recv_buffer_copies = []
+        ghost_size = self.ghost_size
+        # Comm. along X, Y and Z (in that order) for consistency with the subarray
+        # exchange: send to +1 with recv from -1 block, then send to -1 with recv
+        # from +1 block
+        for axis in reversed(range(self.mpi_construct.grid_dim)):
+            axis_size = self.field_size_with_ghost[axis]
+            for send_slice, recv_slice, dest, source in (
+                (
+                    slice(axis_size - 2 * ghost_size, axis_size - ghost_size),
+                    slice(0, ghost_size),
+                    self.mpi_construct.next_grid_along[axis],
+                    self.mpi_construct.previous_grid_along[axis],
+                ),
+                (
+                    slice(ghost_size, 2 * ghost_size),
+                    slice(axis_size - ghost_size, axis_size),
+                    self.mpi_construct.previous_grid_along[axis],
+                    self.mpi_construct.next_grid_along[axis],
+                ),
+            ):
+                send_idx = [
+                    slice(ghost_size, -ghost_size)
+                ] * self.mpi_construct.grid_dim
+                recv_idx = send_idx.copy()
+                send_idx[axis] = send_slice
+                recv_idx[axis] = recv_slice
+                # leading ellipsis for the component axis of vector fields
+                send_view = local_field[(..., *send_idx)]
+                recv_view = local_field[(..., *recv_idx)]
+                send_buffer = np.empty_like(send_view, dtype=self.comm_dtype)
+                recv_buffer = np.empty_like(recv_view, dtype=self.comm_dtype)
+                send_requests.append(
+                    self.mpi_construct.grid.Send_init(send_buffer, dest=dest)
+                )
+                recv_requests.append(
+                    self.mpi_construct.grid.Recv_init(recv_buffer, source=source)
+                )
+                send_buffer_copies.append((send_buffer, send_view))
+                recv_buffer_copies.append((recv_view, recv_buffer))
+        return recv_requests, send_requests, send_buffer_copies, recv_buffer_copies
+
+    def _init_subarray_field_faces_requests(self, local_field, field_types):
         """
+        Create persistent (recv, send) requests for exchanging field ghost data on
+        faces between neighbors, using datatypes from `field_types` (scalar or
+        vector field types).
+        """
+        recv_requests = []
+        send_requests = []
         # Lines below to make code more literal
         z_axis = 0
         y_axis = 1
         x_axis = 2
 
         # Comm. along +X direction: send to (0, 0, +1) with recv from (0, 0, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_0_0_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_0_0_px_type"]),
                 dest=self.mpi_construct.next_grid_along[x_axis],
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_0_0_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_0_0_nx_type"]),
                 source=self.mpi_construct.previous_grid_along[x_axis],
             )
         )
         # Comm. along -X direction: send to (0, 0, -1) with recv from (0, 0, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_0_0_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_0_0_nx_type"]),
                 dest=self.mpi_construct.previous_grid_along[x_axis],
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_0_0_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_0_0_px_type"]),
                 source=self.mpi_construct.next_grid_along[x_axis],
             )
         )
         # Comm. along +Y direction: send to (0, +1, 0) with recv from (0, -1, 0) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_0_py_0_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_0_py_0_type"]),
                 dest=self.mpi_construct.next_grid_along[y_axis],
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_0_ny_0_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_0_ny_0_type"]),
                 source=self.mpi_construct.previous_grid_along[y_axis],
             )
         )
         # Comm. along -Y direction: send to (0, -1, 0) with recv from (0, +1, 0) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_0_ny_0_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_0_ny_0_type"]),
                 dest=self.mpi_construct.previous_grid_along[y_axis],
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_0_py_0_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_0_py_0_type"]),
                 source=self.mpi_construct.next_grid_along[y_axis],
             )
         )
         # Comm. along +Z direction: send to (+1, 0, 0) with recv from (-1, 0, 0) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_0_0_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_0_0_type"]),
                 dest=self.mpi_construct.next_grid_along[z_axis],
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_0_0_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_0_0_type"]),
                 source=self.mpi_construct.previous_grid_along[z_axis],
             )
         )
         # Comm. along -Z direction: send to (-1, 0, 0) with recv from (+1, 0, 0) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_0_0_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_0_0_type"]),
                 dest=self.mpi_construct.previous_grid_along[z_axis],
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_0_0_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_0_0_type"]),
                 source=self.mpi_construct.next_grid_along[z_axis],
             )
         )
+        # subarray datatypes need no packing/unpacking of buffers
+        return recv_requests, send_requests, [], []
 
-    def exchange_scalar_field_edges_init(self, local_field):
+    def _init_field_edges_requests(self, local_field, field_types):
         """
-        Exchange scalar field ghost data on edges between neighbors.
+        Create persistent (recv, send) requests for exchanging field ghost data on
+        edges between neighbors, using datatypes from `field_types` (scalar or
+        vector field types).
         """
+        recv_requests = []
+        send_requests = []
         # Comm. along +Y, +X: send to (0, +1, +1) with recv from (0, -1, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_0_py_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_0_py_px_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[0, 1, 1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_0_ny_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_0_ny_nx_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[0, -1, -1]),
             )
         )
         # Comm. along -Y, +X: send to (0, -1, +1) with recv from (0, +1, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_0_ny_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_0_ny_px_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[0, -1, 1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_0_py_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_0_py_nx_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[0, 1, -1]),
             )
         )
         # Comm. along +Y, -X: send to (0, +1, -1) with recv from (0, -1, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_0_py_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_0_py_nx_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[0, 1, -1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_0_ny_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_0_ny_px_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[0, -1, 1]),
             )
         )
         # Comm. along -Y, -X: send to (0, -1, -1) with recv from (0, +1, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_0_ny_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_0_ny_nx_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[0, -1, -1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_0_py_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_0_py_px_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[0, 1, 1]),
             )
         )
         # Comm. along +Z, +X: send to (+1, 0, +1) with recv from (-1, 0, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_0_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_0_px_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 0, 1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_0_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_0_nx_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 0, -1]),
             )
         )
         # Comm. along -Z, +X: send to (-1, 0, +1) with recv from (+1, 0, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_0_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_0_px_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 0, 1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_0_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_0_nx_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 0, -1]),
             )
         )
         # Comm. along +Z, -X: send to (+1, 0, -1) with recv from (-1, 0, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_0_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_0_nx_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 0, -1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_0_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_0_px_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 0, 1]),
             )
         )
         # Comm. along -Z, -X: send to (-1, 0, -1) with recv from (+1, 0, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_0_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_0_nx_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 0, -1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_0_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_0_px_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 0, 1]),
             )
         )
         # Comm. along +Z, +Y: send to (+1, +1, 0) with recv from (-1, -1, 0) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_py_0_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_py_0_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 1, 0]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_ny_0_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_ny_0_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, -1, 0]),
             )
         )
         # Comm. along -Z, +Y: send to (-1, +1, 0) with recv from (+1, -1, 0) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_py_0_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_py_0_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 1, 0]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_ny_0_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_ny_0_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, -1, 0]),
             )
         )
         # Comm. along +Z, -Y: send to (+1, -1, 0) with recv from (-1, +1, 0) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_ny_0_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_ny_0_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, -1, 0]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_py_0_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_py_0_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 1, 0]),
             )
         )
         # Comm. along -Z, -Y: send to (-1, -1, 0) with recv from (+1, +1, 0) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_ny_0_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_ny_0_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, -1, 0]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_py_0_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_py_0_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 1, 0]),
             )
         )
+        # subarray datatypes need no packing/unpacking of buffers
+        return recv_requests, send_requests, [], []
 
-    def exchange_scalar_field_vertices_init(self, local_field):
+    def _init_field_vertices_requests(self, local_field, field_types):
         """
-        Exchange scalar field ghost data on vertices between neighbors.
+        Create persistent (recv, send) requests for exchanging field ghost data on
+        vertices between neighbors, using datatypes from `field_types` (scalar or
+        vector field types).
         """
+        recv_requests = []
+        send_requests = []
         # Comm. along +Z, +Y, +X: send to (+1, +1, +1) with recv from (-1, -1, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_py_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_py_px_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 1, 1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_ny_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_ny_nx_type"]),
                 source=self._get_diagonally_shifted_coord_rank(
                     coord_shift=[-1, -1, -1]
                 ),
             )
         )
         # Comm. along -Z, +Y, +X: send to (-1, +1, +1) with recv from (+1, -1, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_py_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_py_px_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 1, 1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_ny_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_ny_nx_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, -1, -1]),
             )
         )
         # Comm. along +Z, -Y, +X: send to (+1, -1, +1) with recv from (-1, +1, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_ny_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_ny_px_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, -1, 1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_py_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_py_nx_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 1, -1]),
             )
         )
         # Comm. along +Z, +Y, -X: send to (+1, +1, -1) with recv from (-1, -1, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_py_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_py_nx_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 1, -1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_ny_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_ny_px_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, -1, 1]),
             )
         )
         # Comm. along -Z, -Y, +X: send to (-1, -1, +1) with recv from (+1, +1, -1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_ny_px_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_ny_px_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, -1, 1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_py_nx_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_py_nx_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 1, -1]),
             )
         )
         # Comm. along -Z, +Y, -X: send to (-1, +1, -1) with recv from (+1, -1, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_py_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_py_nx_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 1, -1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_ny_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_ny_px_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, -1, 1]),
             )
         )
         # Comm. along +Z, -Y, -X: send to (+1, -1, -1) with recv from (-1, +1, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_pz_ny_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_pz_ny_nx_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[1, -1, -1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_nz_py_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_nz_py_px_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, 1, 1]),
             )
         )
         # Comm. along -Z, -Y, -X: send to (-1, -1, -1) with recv from (+1, +1, +1) block
-        self.comm_requests.append(
-            self.mpi_construct.grid.Isend(
-                (local_field, self.send_to_nz_ny_nx_type),
+        send_requests.append(
+            self.mpi_construct.grid.Send_init(
+                (local_field, field_types["send_to_nz_ny_nx_type"]),
                 dest=self._get_diagonally_shifted_coord_rank(coord_shift=[-1, -1, -1]),
             )
         )
-        self.comm_requests.append(
-            self.mpi_construct.grid.Irecv(
-                (local_field, self.recv_from_pz_py_px_type),
+        recv_requests.append(
+            self.mpi_construct.grid.Recv_init(
+                (local_field, field_types["recv_from_pz_py_px_type"]),
                 source=self._get_diagonally_shifted_coord_rank(coord_shift=[1, 1, 1]),
             )
         )
+        # subarray datatypes need no packing/unpacking of buffers
+        return recv_requests, send_requests, [], []
+
+    def _init_field_full_requests(self, local_field, field_types):
+        """
+        Create persistent (recv, send) requests for exchanging field ghost data on
+        all faces, edges and vertices between neighbors.
+        """
+        recv_requests = []
+        send_requests = []
+        send_buffer_copies = []
+        recv_buffer_copies = []
+        for init_requests in (
+            self._init_field_faces_requests,
+            self._init_field_edges_requests,
+            self._init_field_vertices_requests,
+        ):
+            recvs, sends, send_copies, recv_copies = init_requests(
+                local_field, field_types
+            )
+            recv_requests.extend(recvs)
+            send_requests.extend(sends)
+            send_buffer_copies.extend(send_copies)
+            recv_buffer_copies.extend(recv_copies)
+        return recv_requests, send_requests, send_buffer_copies, recv_buffer_copies
+
+    def _get_persistent_requests(self, init_requests, local_field, field_types):
+        """
+        Get the key and the persistent (recv, send) requests and buffer copies
+        (created once by `init_requests`) for exchanging ghost data of `local_field`.
+
+        The requests are cached per buffer address and layout, and are created again
+        only if a field with a new buffer is exchanged. Since the requests hold on
+        to the field, the least recently used ones are freed beyond
+        `persistent_requests_cache_size` fields.
+        """
+        key = (
+            init_requests.__name__,
+            local_field.__array_interface__["data"][0],
+            local_field.shape,
+            local_field.strides,
+            local_field.dtype,
+        )
+        if key in self.persistent_requests:
+            self.persistent_requests.move_to_end(key)
+        else:
+            self._free_persistent_requests(
+                max_cached_fields=self.persistent_requests_cache_size - 1
+            )
+            self.persistent_requests[key] = init_requests(local_field, field_types)
+        return key, self.persistent_requests[key]
+
+    def _free_persistent_requests(self, max_cached_fields):
+        """
+        Free the least recently used (and inactive) persistent requests, until
+        at most `max_cached_fields` remain cached.
+        """
+        for key in list(self.persistent_requests):
+            if len(self.persistent_requests) <= max_cached_fields:
+                break
+            if key in self.active_recv_keys or key in self.active_send_keys:
+                continue
+            recv_requests, send_requests, _, _ = self.persistent_requests.pop(key)
+            for request in recv_requests + send_requests:
+                request.Free()
+
+    def free_persistent_requests(self):
+        """
+        Free all cached persistent requests (and the references they hold to the
+        exchanged fields). The requests are created again on the next exchange.
+        """
+        if self.comm_requests:
+            raise RuntimeError(
+                "Cannot free persistent requests during an ongoing exchange, "
+                "call exchange_finalise first."
+            )
+        self._free_persistent_requests(max_cached_fields=0)
+
+    def _get_inactive_requests(self, init_requests, local_field, field_types, active):
+        """
+        Get the (recv, send) requests and buffer copies for exchanging ghost data of
+        `local_field`, for starting the recvs (or sends) with keys in `active`.
+
+        If those are still active, i.e. the same field is exchanged again before
+        `exchange_finalise`, we fall back to temporary requests, freed on finalise.
+        """
+        key, requests = self._get_persistent_requests(
+            init_requests, local_field, field_types
+        )
+        if key not in active:
+            active.add(key)
+            return requests
+        requests = init_requests(local_field, field_types)
+        recv_requests, send_requests, _, _ = requests
+        self.temporary_requests.extend(recv_requests + send_requests)
+        return requests
+
+    def _start_requests(self, requests):
+        """Helper function to start persistent requests, to be finalised later."""
+        MPI.Prequest.Startall(requests)
+        self.comm_requests.extend(requests)
+
+    def _start_recvs(self, init_requests, local_field, field_types):
+        """Helper function to start recvs, with buffers unpacked on finalise."""
+        recv_requests, _, _, recv_buffer_copies = self._get_inactive_requests(
+            init_requests, local_field, field_types, self.active_recv_keys
+        )
+        self._start_requests(recv_requests)
+        self.pending_recv_buffer_copies.extend(recv_buffer_copies)
+
+    def _start_sends(self, init_requests, local_field, field_types):
+        """Helper function to pack send buffers (if any) and start sends."""
+        _, send_requests, send_buffer_copies, _ = self._get_inactive_requests(
+            init_requests, local_field, field_types, self.active_send_keys
+        )
+        for buffer, field_view in send_buffer_copies:
+            np.copyto(buffer, field_view)
+        self._start_requests(send_requests)
+
+    def _start_persistent_exchange(self, init_requests, local_field, field_types):
+        """
+        Start the persistent requests (created once by `init_requests`) for
+        exchanging ghost data of `local_field`.
+
+        All recvs are started before the sends, so that incoming messages can be
+        matched directly into the (already posted) ghost cells of the field.
+        """
+        self._start_recvs(init_requests, local_field, field_types)
+        self._start_sends(init_requests, local_field, field_types)
+
+    def exchange_scalar_field_post_recvs(self, local_field):
+        """
+        Post only the recvs of the scalar field ghost exchange.
+
+        Together with `exchange_scalar_field_post_sends` this splits
+        `exchange_scalar_field_init`, so that the recvs can be posted before the
+        computation which updates (the inner cells of) `local_field`, i.e.
+        post recvs -> compute field -> post sends -> crunch interior stencil ->
+        `exchange_finalise` -> crunch boundary stencil.
+        """
+        self._start_recvs(
+            self._init_field_requests, local_field, self.scalar_field_types
+        )
+
+    def exchange_scalar_field_post_sends(self, local_field):
+        """
+        Post only the sends of the scalar field ghost exchange, to be called after
+        `exchange_scalar_field_post_recvs` on the same field.
+        """
+        self._start_sends(
+            self._init_field_requests, local_field, self.scalar_field_types
+        )
+
+    def exchange_scalar_field_faces_init(self, local_field):
+        """
+        Exchange scalar field ghost data on faces between neighbors.
+        """
+        self._start_persistent_exchange(
+            self._init_field_faces_requests, local_field, self.scalar_field_types
+        )
+
+    def exchange_scalar_field_edges_init(self, local_field):
+        """
+        Exchange scalar field ghost data on edges between neighbors.
+        """
+        self._start_persistent_exchange(
+            self._init_field_edges_requests, local_field, self.scalar_field_types
+        )
+
+    def exchange_scalar_field_vertices_init(self, local_field):
+        """
+        Exchange scalar field ghost data on vertices between neighbors.
+        """
+        self._start_persistent_exchange(
+            self._init_field_vertices_requests, local_field, self.scalar_field_types
+        )
 
     def exchange_scalar_field_full_init(self, local_field):
         """
         Exchange scalar field ghost data including all faces, edges and vertices between
         neighbors.
         """
-        self.exchange_scalar_field_faces_init(local_field)
-        self.exchange_scalar_field_edges_init(local_field)
-        self.exchange_scalar_field_vertices_init(local_field)
+        self._start_persistent_exchange(
+            self._init_field_full_requests, local_field, self.scalar_field_types
+        )
 
-    def exchange_vector_field_init(self, local_vector_field):
-        self.exchange_scalar_field_init(
-            local_field=local_vector_field[VectorField.x_axis_idx()]
+    def exchange_vector_field_faces_init(self, local_vector_field):
+        """
+        Exchange (contiguous) vector field ghost data on faces between neighbors,
+        with all components in a single message per neighbor.
+        """
+        self._start_persistent_exchange(
+            self._init_field_faces_requests, local_vector_field, self.vector_field_types
         )
-        self.exchange_scalar_field_init(
-            local_field=local_vector_field[VectorField.y_axis_idx()]
+
+    def exchange_vector_field_edges_init(self, local_vector_field):
+        """
+        Exchange (contiguous) vector field ghost data on edges between neighbors,
+        with all components in a single message per neighbor.
+        """
+        self._start_persistent_exchange(
+            self._init_field_edges_requests, local_vector_field, self.vector_field_types
         )
-        self.exchange_scalar_field_init(
-            local_field=local_vector_field[VectorField.z_axis_idx()]
+
+    def exchange_vector_field_vertices_init(self, local_vector_field):
+        """
+        Exchange (contiguous) vector field ghost data on vertices between neighbors,
+        with all components in a single message per neighbor.
+        """
+        self._start_persistent_exchange(
+            self._init_field_vertices_requests,
+            local_vector_field,
+            self.vector_field_types,
         )
 
+    def exchange_vector_field_full_init(self, local_vector_field):
+        """
+        Exchange (contiguous) vector field ghost data including all faces, edges and
+        vertices between neighbors, with all components in a single message per
+        neighbor.
+        """
+        self._start_persistent_exchange(
+            self._init_field_full_requests,
+            local_vector_field,
+            self.vector_field_types,
+        )
+
+    def exchange_vector_field_init(self, local_vector_field):
+        """
+        Exchange vector field ghost data between neighbors.
+
+        All components are exchanged together if the vector field is contiguous,
+        otherwise we fall back to exchanging the components one by one.
+        """
+        if local_vector_field.flags.c_contiguous:
+            self._exchange_contiguous_vector_field_init(local_vector_field)
+        else:
+            self.exchange_scalar_field_init(
+                local_field=local_vector_field[VectorField.x_axis_idx()]
+            )
+            self.exchange_scalar_field_init(
+                local_field=local_vector_field[VectorField.y_axis_idx()]
+            )
+            self.exchange_scalar_field_init(
+                local_field=local_vector_field[VectorField.z_axis_idx()]
+            )
+
     def exchange_finalise(self):
         """
         Finalizing non-blocking exchange ghost data between neighbors.
         """
         MPI.Request.Waitall(self.comm_requests)
+        # unpack recv buffers (if any) into the ghost cells
+        for field_view, buffer in self.pending_recv_buffer_copies:
+            np.copyto(field_view, buffer)
+        for request in self.temporary_requests:
+            request.Free()
         # reset the list of requests
         self.comm_requests = []
+        self.pending_recv_buffer_copies = []
+        self.temporary_requests = []
+        self.active_recv_keys.clear()
+        self.active_send_keys.clear()
 
 
 class MPIFieldCommunicator3D:
@@ -1169,141 +1555,219 @@ class MPIFieldCommunicator3D:
             ) * mpi_construct.grid_dim
         # Datatypes for subdomain used in gather and scatter
         field_sub_size = mpi_construct.local_grid_size
-        # master rank uses datatype for receiving sub arrays in full array
         self.master_rank = master_rank
-        self.slave_ranks = set(np.arange(mpi_construct.size)) - set([self.master_rank])
+        self.slave_ranks = tuple(
+            rank_idx
+            for rank_idx in range(mpi_construct.size)
+            if rank_idx != self.master_rank
+        )
+        # Each rank sends/receives a single sub array, starting at its grid coords
+        self.sub_array_counts = np.ones(mpi_construct.size, dtype=np.int32)
+        sub_array_displacements = [
+            np.ravel_multi_index(
+                np.array(mpi_construct.grid.Get_coords(rank_idx))
+                * mpi_construct.local_grid_size,
+                mpi_construct.global_grid_size,
+            )
+            for rank_idx in range(mpi_construct.size)
+        ]
+        # displacements of the collectives are C ints, hence they need to fit in
+        # int32 (else they would silently wrap around)
+        if max(sub_array_displacements) > np.iinfo(np.int32).max:
+            logger.error(
+                f"Global grid {mpi_construct.global_grid_size} is too large for "
+                "gather/scatter, sub array displacements exceed the int32 range!"
+            )
+            raise ValueError("Global grid too large for field communication")
+        self.sub_array_displacements = np.array(sub_array_displacements, dtype=np.int32)
+        # All ranks (master included) use datatype for sending/receiving sub arrays
+        # from the inner cells of their local field
+        self.local_sub_array_type = mpi_construct.dtype_generator.Create_subarray(
+            sizes=mpi_construct.local_grid_size + 2 * self.ghost_size,
+            subsizes=field_sub_size,
+            starts=[self.ghost_size] * mpi_construct.grid_dim,
+        )
+        self.local_sub_array_type.Commit()
+        # Stacks the above datatype for all components of a (contiguous) vector
+        # field, so that all components are communicated in a single collective
+        dtype_size = mpi_construct.dtype_generator.Get_size()
+        self.local_vector_sub_array_type = self.local_sub_array_type.Create_hvector(
+            count=mpi_construct.grid_dim,
+            blocklength=1,
+            stride=np.prod(mpi_construct.local_grid_size + 2 * self.ghost_size)
+            * dtype_size,
+        )
+        self.local_vector_sub_array_type.Commit()
+        # master rank uses datatype for receiving/sending sub arrays in full array,
+        # resized to the extent of a single element so that the location of each sub
+        # array can be given as displacement (in elements) in the collectives below
         if mpi_construct.rank == self.master_rank:
-            field_size = mpi_construct.global_grid_size
-            self.sub_array_type = mpi_construct.dtype_generator.Create_subarray(
-                sizes=field_size,
+            global_sub_array_type = mpi_construct.dtype_generator.Create_subarray(
+                sizes=mpi_construct.global_grid_size,
                 subsizes=field_sub_size,
                 starts=[0] * mpi_construct.grid_dim,
             )
-        # Other ranks use datatype for sending sub arrays
-        else:
-            field_size = mpi_construct.local_grid_size + 2 * self.ghost_size
-            self.sub_array_type = mpi_construct.dtype_generator.Create_subarray(
-                sizes=field_size,
-                subsizes=field_sub_size,
-                starts=[self.ghost_size] * mpi_construct.grid_dim,
+            self.global_sub_array_type = global_sub_array_type.Create_resized(
+                lb=0, extent=dtype_size
+            )
+            self.global_sub_array_type.Commit()
+            self.global_vector_sub_array_type = global_sub_array_type.Create_hvector(
+                count=mpi_construct.grid_dim,
+                blocklength=1,
+                stride=np.prod(mpi_construct.global_grid_size) * dtype_size,
+            ).Create_resized(lb=0, extent=dtype_size)
+            self.global_vector_sub_array_type.Commit()
+
+    def _global_field_buffer(self, global_field, vector_field=False):
+        """
+        Helper function returning the buffer spec of the global (scalar or vector)
+        field for the collectives, which is only significant on the master rank.
+        """
+        if self.mpi_construct.rank != self.master_rank:
+            return None
+        return [
+            global_field,
+            self.sub_array_counts,
+            self.sub_array_displacements,
+            self.global_vector_sub_array_type
+            if vector_field
+            else self.global_sub_array_type,
+        ]
+
+    def _contiguous_global_vector_field(self, global_vector_field, copy_values):
+        """
+        Helper function returning the global vector field as one C contiguous array
+        in master rank, as needed by the vector collectives. Tuples of components and
+        strided views are staged through a contiguous copy (whose values are only
+        filled if `copy_values` is set), which is only significant on master rank.
+        """
+        if self.mpi_construct.rank != self.master_rank:
+            return None
+        global_grid_size = tuple(self.mpi_construct.global_grid_size)
+        if len(global_vector_field) != self.mpi_construct.grid_dim or any(
+            np.shape(component) != global_grid_size for component in global_vector_field
+        ):
+            # python error handling exception would not work here because it halts the
+            # process before abort is called
+            logger.error(
+                "global_vector_field needs to be shape "
+                f"({self.mpi_construct.grid_dim}, {global_grid_size})"
+            )
+            self.mpi_construct.grid.Abort()
+        if (
+            isinstance(global_vector_field, np.ndarray)
+            and global_vector_field.flags.c_contiguous
+            and global_vector_field.dtype == self.mpi_construct.real_t
+        ):
+            return global_vector_field
+        if copy_values:
+            return np.ascontiguousarray(
+                global_vector_field, dtype=self.mpi_construct.real_t
             )
-        self.sub_array_type.Commit()
+        return np.empty(
+            (self.mpi_construct.grid_dim, *global_grid_size),
+            dtype=self.mpi_construct.real_t,
+        )
 
     def gather_local_scalar_field(self, global_field, local_field):
         """
         Gather local scalar fields from all ranks and return a global scalar field in
         rank 0
         """
-        if self.mpi_construct.rank == self.master_rank:
-            # Fill in field values for master rank
-            coords = self.mpi_construct.grid.Get_coords(self.master_rank)
-            local_chunk_idx = (
-                slice(
-                    coords[0] * self.mpi_construct.local_grid_size[0],
-                    (coords[0] + 1) * self.mpi_construct.local_grid_size[0],
-                ),
-                slice(
-                    coords[1] * self.mpi_construct.local_grid_size[1],
-                    (coords[1] + 1) * self.mpi_construct.local_grid_size[1],
-                ),
-                slice(
-                    coords[2] * self.mpi_construct.local_grid_size[2],
-                    (coords[2] + 1) * self.mpi_construct.local_grid_size[2],
-                ),
-            )
-            global_field[local_chunk_idx] = local_field[self.inner_idx]
-            # Receiving from other ranks as contiguous array
-            for rank_idx in self.slave_ranks:
-                coords = self.mpi_construct.grid.Get_coords(rank_idx)
-                idx = np.ravel_multi_index(
-                    coords * self.mpi_construct.local_grid_size,
-                    self.mpi_construct.global_grid_size,
-                )
-                self.mpi_construct.grid.Recv(
-                    (global_field.ravel()[idx:], 1, self.sub_array_type),
-                    source=rank_idx,
-                )
-        else:
-            # Sending as contiguous chunks
-            self.mpi_construct.grid.Send(
-                (local_field, 1, self.sub_array_type), dest=self.master_rank
-            )
+        self.mpi_construct.grid.Gatherv(
+            sendbuf=[local_field, 1, self.local_sub_array_type],
+            recvbuf=self._global_field_buffer(global_field),
+            root=self.master_rank,
+        )
 
     def gather_local_vector_field(self, global_vector_field, local_vector_field):
         """
         Gather local vector fields from all ranks and return a global vector field in
         rank 0
+
+        All components are gathered together if the local vector field is contiguous,
+        otherwise we fall back to gathering the components one by one. In master rank
+        the global vector field may be a tuple of components or a strided view, in
+        which case it is gathered into a contiguous buffer and copied over.
         """
-        self.gather_local_scalar_field(
-            global_field=global_vector_field[VectorField.x_axis_idx()],
-            local_field=local_vector_field[VectorField.x_axis_idx()],
-        )
-        self.gather_local_scalar_field(
-            global_field=global_vector_field[VectorField.y_axis_idx()],
-            local_field=local_vector_field[VectorField.y_axis_idx()],
-        )
-        self.gather_local_scalar_field(
-            global_field=global_vector_field[VectorField.z_axis_idx()],
-            local_field=local_vector_field[VectorField.z_axis_idx()],
-        )
+        if local_vector_field.flags.c_contiguous:
+            global_vector_buffer = self._contiguous_global_vector_field(
+                global_vector_field, copy_values=False
+            )
+            self.mpi_construct.grid.Gatherv(
+                sendbuf=[local_vector_field, 1, self.local_vector_sub_array_type],
+                recvbuf=self._global_field_buffer(
+                    global_vector_buffer, vector_field=True
+                ),
+                root=self.master_rank,
+            )
+            if (
+                self.mpi_construct.rank == self.master_rank
+                and global_vector_buffer is not global_vector_field
+            ):
+                for global_component, buffer_component in zip(
+                    global_vector_field, global_vector_buffer
+                ):
+                    np.copyto(global_component, buffer_component)
+        else:
+            self.gather_local_scalar_field(
+                global_field=global_vector_field[VectorField.x_axis_idx()],
+                local_field=local_vector_field[VectorField.x_axis_idx()],
+            )
+            self.gather_local_scalar_field(
+                global_field=global_vector_field[VectorField.y_axis_idx()],
+                local_field=local_vector_field[VectorField.y_axis_idx()],
+            )
+            self.gather_local_scalar_field(
+                global_field=global_vector_field[VectorField.z_axis_idx()],
+                local_field=local_vector_field[VectorField.z_axis_idx()],
+            )
 
     def scatter_global_scalar_field(self, local_field, global_field):
         """
         Scatter a global scalar field in rank 0 into local scalar fields in each
         corresponding ranks
         """
-        # Fill in field values for master rank on the edge
-        if self.mpi_construct.rank == self.master_rank:
-            coords = self.mpi_construct.grid.Get_coords(self.master_rank)
-            local_chunk_idx = (
-                slice(
-                    coords[0] * self.mpi_construct.local_grid_size[0],
-                    (coords[0] + 1) * self.mpi_construct.local_grid_size[0],
-                ),
-                slice(
-                    coords[1] * self.mpi_construct.local_grid_size[1],
-                    (coords[1] + 1) * self.mpi_construct.local_grid_size[1],
-                ),
-                slice(
-                    coords[2] * self.mpi_construct.local_grid_size[2],
-                    (coords[2] + 1) * self.mpi_construct.local_grid_size[2],
-                ),
-            )
-            local_field[self.inner_idx] = global_field[local_chunk_idx]
-            # Sending to other ranks as contiguous array
-            for rank_idx in self.slave_ranks:
-                coords = self.mpi_construct.grid.Get_coords(rank_idx)
-                idx = np.ravel_multi_index(
-                    coords * self.mpi_construct.local_grid_size,
-                    self.mpi_construct.global_grid_size,
-                )
-                self.mpi_construct.grid.Send(
-                    (global_field.ravel()[idx:], 1, self.sub_array_type),
-                    dest=rank_idx,
-                )
-        else:
-            # Receiving from rank 0 as contiguous array
-            self.mpi_construct.grid.Recv(
-                (local_field, 1, self.sub_array_type), source=self.master_rank
-            )
+        self.mpi_construct.grid.Scatterv(
+            sendbuf=self._global_field_buffer(global_field),
+            recvbuf=[local_field, 1, self.local_sub_array_type],
+            root=self.master_rank,
+        )
 
     def scatter_global_vector_field(self, local_vector_field, global_vector_field):
         """
         Scatter a global vector field in master rank into local vector fields in each
         corresponding ranks
+
+        All components are scattered together if the local vector field is
+        contiguous, otherwise we fall back to scattering the components one by one. In
+        master rank the global vector field may be a tuple of components or a strided
+        view, in which case it is first copied into a contiguous buffer.
         """
-        self.scatter_global_scalar_field(
-            local_field=local_vector_field[VectorField.x_axis_idx()],
-            global_field=global_vector_field[VectorField.x_axis_idx()],
-        )
-        self.scatter_global_scalar_field(
-            local_field=local_vector_field[VectorField.y_axis_idx()],
-            global_field=global_vector_field[VectorField.y_axis_idx()],
-        )
-        self.scatter_global_scalar_field(
-            local_field=local_vector_field[VectorField.z_axis_idx()],
-            global_field=global_vector_field[VectorField.z_axis_idx()],
-        )
+        if local_vector_field.flags.c_contiguous:
+            self.mpi_construct.grid.Scatterv(
+                sendbuf=self._global_field_buffer(
+                    self._contiguous_global_vector_field(
+                        global_vector_field, copy_values=True
+                    ),
+                    vector_field=True,
+                ),
+                recvbuf=[local_vector_field, 1, self.local_vector_sub_array_type],
+                root=self.master_rank,
+            )
+        else:
+            self.scatter_global_scalar_field(
+                local_field=local_vector_field[VectorField.x_axis_idx()],
+                global_field=global_vector_field[VectorField.x_axis_idx()],
+            )
+            self.scatter_global_scalar_field(
+                local_field=local_vector_field[VectorField.y_axis_idx()],
+                global_field=global_vector_field[VectorField.y_axis_idx()],
+            )
+            self.scatter_global_scalar_field(
+                local_field=local_vector_field[VectorField.z_axis_idx()],
+                global_field=global_vector_field[VectorField.z_axis_idx()],
+            )
 
 
 class MPILagrangianFieldCommunicator3D:
@@ -0,0 +1,169 @@
+from functools import lru_cache
+import pytest
+from mpi4py import MPI
+from sopht_mpi.utils import (
+    MPIConstruct2D,
+    MPIConstruct3D,
+    MPIGhostCommunicator2D,
+    MPIGhostCommunicator3D,
+    MPIFieldCommunicator2D,
+    MPIFieldCommunicator3D,
+)
+
+
+def _gen_cached_mpi_object(mpi_object_cls, mpi_objects):
+    """Returns a cached constructor of `mpi_object_cls`, which also records the
+    constructed instances in `mpi_objects`, so that they can be freed later."""
+
+    @lru_cache(maxsize=None)
+    def cached_mpi_object(*args, **kwargs):
+        mpi_object = mpi_object_cls(*args, **kwargs)
+        mpi_objects.append(mpi_object)
+        return mpi_object
+
+    return cached_mpi_object
+
+
+def _free_mpi_datatypes(mpi_object):
+    """Frees the derived datatypes committed by an MPI (ghost or field)
+    communicator, stored either as attributes or in dicts of datatypes."""
+    datatypes = []
+    for attribute in vars(mpi_object).values():
+        if isinstance(attribute, dict):
+            datatypes.extend(attribute.values())
+        else:
+            datatypes.append(attribute)
+    for datatype in datatypes:
+        # datatypes stored twice are already null after the first free
+        if (
+            isinstance(datatype, MPI.Datatype)
+            and datatype != MPI.DATATYPE_NULL
+            and not datatype.is_predefined
+        ):
+            datatype.Free()
+
+
+@pytest.fixture(scope="session")
+def cached_mpi_objects():
+    """
+    Session wide registry of the cached MPI constructs and communicators, which
+    frees them at the end of the session in one ordered teardown: first the
+    persistent requests and datatypes of the communicators, then the cartesian
+    communicators of the constructs they are built on. Freeing is collective,
+    which is fine since all ranks cached them in the same order.
+    """
+    mpi_objects = {
+        "ghost_communicators": [],
+        "field_communicators": [],
+        "constructs": [],
+    }
+    yield mpi_objects
+    for mpi_ghost_communicator in mpi_objects["ghost_communicators"]:
+        if hasattr(mpi_ghost_communicator, "free_persistent_requests"):
+            mpi_ghost_communicator.free_persistent_requests()
+        _free_mpi_datatypes(mpi_ghost_communicator)
+    for mpi_field_communicator in mpi_objects["field_communicators"]:
+        _free_mpi_datatypes(mpi_field_communicator)
+    for mpi_construct in mpi_objects["constructs"]:
+        mpi_construct.grid.Free()
+
+
+@pytest.fixture(scope="session")
+def cached_mpi_construct_2d(cached_mpi_objects):
+    """
+    Session wide cache of MPIConstruct2D, so that parametrized tests sharing
+    the same topology reuse the cartesian communicator and its datatypes.
+    Construction is collective, hence all ranks must query the cache with
+    identical arguments in the same order (which holds for pytest-mpi runs).
+    The cartesian communicators are freed at the end of the session.
+    """
+    return _gen_cached_mpi_object(MPIConstruct2D, cached_mpi_objects["constructs"])
+
+
+@pytest.fixture(scope="session")
+def cached_mpi_construct_3d(cached_mpi_objects):
+    """Session wide cache of MPIConstruct3D, see cached_mpi_construct_2d."""
+    return _gen_cached_mpi_object(MPIConstruct3D, cached_mpi_objects["constructs"])
+
+
+def _checkout_mpi_ghost_communicators(cached_mpi_ghost_communicator):
+    """
+    Generator yielding a constructor for checking out (session wide cached) ghost
+    communicators in a single test. Since the communicators are shared across
+    tests, exchanges left pending by the test (e.g. when it failed in between
+    init and finalise) are finalised afterwards, so that they do not leak into
+    the next test checking out the same communicator. Finalising is collective,
+    which is fine since all ranks run (and fail) the same test.
+    """
+    mpi_ghost_communicators = []
+
+    def checkout_mpi_ghost_communicator(*args, **kwargs):
+        mpi_ghost_communicator = cached_mpi_ghost_communicator(*args, **kwargs)
+        mpi_ghost_communicators.append(mpi_ghost_communicator)
+        return mpi_ghost_communicator
+
+    yield checkout_mpi_ghost_communicator
+    for mpi_ghost_communicator in mpi_ghost_communicators:
+        if mpi_ghost_communicator.comm_requests:
+            mpi_ghost_communicator.exchange_finalise()
+
+
+@pytest.fixture(scope="session")
+def session_mpi_ghost_communicator_2d(cached_mpi_objects):
+    """Session wide cache of MPIGhostCommunicator2D, keyed on its arguments."""
+    return _gen_cached_mpi_object(
+        MPIGhostCommunicator2D, cached_mpi_objects["ghost_communicators"]
+    )
+
+
+@pytest.fixture(scope="session")
+def session_mpi_ghost_communicator_3d(cached_mpi_objects):
+    """
+    Session wide cache of MPIGhostCommunicator3D, keyed on its arguments.
+    The persistent requests of the cached communicators (which hold on to the
+    exchanged fields) are freed at the end of the session.
+    """
+    return _gen_cached_mpi_object(
+        MPIGhostCommunicator3D, cached_mpi_objects["ghost_communicators"]
+    )
+
+
+@pytest.fixture
+def cached_mpi_ghost_communicator_2d(session_mpi_ghost_communicator_2d):
+    """Per test checkout of the cached MPIGhostCommunicator2D, which finalises
+    exchanges left pending by the test, see _checkout_mpi_ghost_communicators."""
+    yield from _checkout_mpi_ghost_communicators(session_mpi_ghost_communicator_2d)
+
+
+@pytest.fixture
+def cached_mpi_ghost_communicator_3d(session_mpi_ghost_communicator_3d):
+    """Per test checkout of the cached MPIGhostCommunicator3D, which finalises
+    exchanges left pending by the test, see _checkout_mpi_ghost_communicators."""
+    yield from _checkout_mpi_ghost_communicators(session_mpi_ghost_communicator_3d)
+
+
+@pytest.fixture(scope="session")
+def cached_mpi_field_communicator_2d(cached_mpi_objects):
+    """Session wide cache of MPIFieldCommunicator2D, keyed on its arguments."""
+    return _gen_cached_mpi_object(
+        MPIFieldCommunicator2D, cached_mpi_objects["field_communicators"]
+    )
+
+
+@pytest.fixture(scope="session")
+def cached_mpi_field_communicator_3d(cached_mpi_objects):
+    """Session wide cache of MPIFieldCommunicator3D, keyed on its arguments."""
+    return _gen_cached_mpi_object(
+        MPIFieldCommunicator3D, cached_mpi_objects["field_communicators"]
+    )
+
+
+@pytest.fixture(scope="session", params=["single", "double"])
+def precision(request):
+    """
+    Session scoped precision, so that pytest groups the tests using it by
+    precision, and generated (cached) kernels and MPI constructs of one
+    precision are reused by all tests before switching to the other one.
+    Tests can still override it with their own parametrization.
+    """
+    return request.param
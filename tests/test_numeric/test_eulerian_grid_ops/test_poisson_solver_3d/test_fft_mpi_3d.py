@@ -52,14 +52,11 @@ def test_mpi_fft_3d(ghost_size, precision, rank_distribution, aspect_ratio):
     scatter_global_scalar_field = mpi_field_comm.scatter_global_scalar_field
     local_field_inner_idx = mpi_field_comm.inner_idx
 
-    # Generate solution and broadcast solution from rank 0 to all ranks
-    if mpi_construct.rank == 0:
-        ref_field = np.random.randn(grid_size_z, grid_size_y, grid_size_x).astype(
-            real_t
-        )
-    else:
-        ref_field = None
-    ref_field = mpi_construct.grid.bcast(ref_field, root=0)
+    # Generate solution on all ranks, identically seeded so no broadcast is needed
+    rng = np.random.default_rng(seed=0)
+    ref_field = rng.standard_normal((grid_size_z, grid_size_y, grid_size_x)).astype(
+        real_t
+    )
 
     # 1. Scatter initial local field from solution ref field
     local_field = np.zeros(mpi_construct.local_grid_size + 2 * ghost_size).astype(
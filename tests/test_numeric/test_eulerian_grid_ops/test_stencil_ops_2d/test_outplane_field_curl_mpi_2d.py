@@ -4,29 +4,30 @@ from sopht.utils.precision import get_real_t, get_test_tol
 from sopht.numeric.eulerian_grid_ops.stencil_ops_2d import (
     gen_outplane_field_curl_pyst_kernel_2d,
 )
-from sopht_mpi.utils import (
-    MPIConstruct2D,
-    MPIGhostCommunicator2D,
-    MPIFieldCommunicator2D,
-)
 from sopht_mpi.numeric.eulerian_grid_ops.stencil_ops_2d import (
     gen_outplane_field_curl_pyst_mpi_kernel_2d,
 )
+from mpi4py import MPI
 
 
 @pytest.mark.mpi(group="MPI_stencil_ops_2d", min_size=4)
 @pytest.mark.parametrize("ghost_size", [1, 2])
-@pytest.mark.parametrize("precision", ["single", "double"])
 @pytest.mark.parametrize("rank_distribution", [(1, 0), (0, 1)])
 @pytest.mark.parametrize("aspect_ratio", [(1, 1), (1, 1.5)])
 def test_mpi_outplane_field_curl_2d(
-    ghost_size, precision, rank_distribution, aspect_ratio
+    ghost_size,
+    precision,
+    rank_distribution,
+    aspect_ratio,
+    cached_mpi_construct_2d,
+    cached_mpi_ghost_communicator_2d,
+    cached_mpi_field_communicator_2d,
 ):
     n_values = 8
     grid_size_y, grid_size_x = (n_values * np.array(aspect_ratio)).astype(int)
     real_t = get_real_t(precision)
-    # Generate the MPI topology minimal object
-    mpi_construct = MPIConstruct2D(
+    # Generate (or reuse from an earlier test) the MPI topology minimal object
+    mpi_construct = cached_mpi_construct_2d(
         grid_size_y=grid_size_y,
         grid_size_x=grid_size_x,
         real_t=real_t,
@@ -34,10 +35,10 @@ def test_mpi_outplane_field_curl_2d(
     )
 
     # extra width needed for kernel computation
-    mpi_ghost_exchange_communicator = MPIGhostCommunicator2D(
+    mpi_ghost_exchange_communicator = cached_mpi_ghost_communicator_2d(
         ghost_size=ghost_size, mpi_construct=mpi_construct
     )
-    mpi_field_communicator = MPIFieldCommunicator2D(
+    mpi_field_communicator = cached_mpi_field_communicator_2d(
         ghost_size=ghost_size, mpi_construct=mpi_construct
     )
     gather_local_vector_field = mpi_field_communicator.gather_local_vector_field
@@ -48,24 +49,26 @@ def test_mpi_outplane_field_curl_2d(
         (
             mpi_construct.local_grid_size[0] + 2 * ghost_size,
             mpi_construct.local_grid_size[1] + 2 * ghost_size,
-        )
-    ).astype(real_t)
-    local_curl = np.zeros(
-        (
-            mpi_construct.grid_dim,
-            mpi_construct.local_grid_size[0] + 2 * ghost_size,
-            mpi_construct.local_grid_size[1] + 2 * ghost_size,
-        )
-    ).astype(real_t)
+        ),
+        dtype=real_t,
+    )
+    # Allocate local curl filled with a sentinel, followed by a guard element, to
+    # check that the kernel does not write outside the local domain
+    local_curl_shape = (mpi_construct.grid_dim, *local_field.shape)
+    local_curl_buffer = np.full(
+        np.prod(local_curl_shape) + 1, fill_value=np.nan, dtype=real_t
+    )
+    local_curl = local_curl_buffer[:-1].reshape(local_curl_shape)
 
-    # Initialize and broadcast solution for comparison later
+    # Initialize solution for comparison later
     if mpi_construct.rank == 0:
-        ref_field = np.random.rand(grid_size_y, grid_size_x).astype(real_t)
-        prefactor = real_t(0.1)
+        ref_field = np.random.default_rng().random(
+            (grid_size_y, grid_size_x), dtype=real_t
+        )
     else:
         ref_field = None
-        prefactor = None
-    prefactor = mpi_construct.grid.bcast(prefactor, root=0)
+    # identical on all ranks, hence needs no broadcast
+    prefactor = real_t(0.1)
 
     # scatter global field
     scatter_global_scalar_field(local_field, ref_field)
@@ -83,18 +86,37 @@ def test_mpi_outplane_field_curl_2d(
         prefactor=prefactor,
     )
 
-    # gather back the diffusion flux globally
-    global_curl = np.zeros((mpi_construct.grid_dim, grid_size_y, grid_size_x)).astype(
-        real_t
-    )
+    # gather back the diffusion flux globally (only master needs the global field)
+    if mpi_construct.rank == 0:
+        global_curl = np.empty(
+            (mpi_construct.grid_dim, grid_size_y, grid_size_x), dtype=real_t
+        )
+    else:
+        global_curl = (None,) * mpi_construct.grid_dim
     gather_local_vector_field(global_curl, local_curl)
 
+    # ghost zone of curl is untouched, except on physical domain boundaries
+    # where it is set to zero, and so is the guard element past the local curl
+    ref_local_curl = np.full_like(local_curl, fill_value=np.nan)
+    for axis in range(mpi_construct.grid_dim):
+        axis_idx = (slice(None),) * (axis + 1)
+        if mpi_construct.previous_grid_along[axis] == MPI.PROC_NULL:
+            ref_local_curl[(*axis_idx, slice(None, ghost_size + 1))] = 0
+        if mpi_construct.next_grid_along[axis] == MPI.PROC_NULL:
+            ref_local_curl[(*axis_idx, slice(-ghost_size - 1, None))] = 0
+    ghost_mask = np.ones_like(local_field, dtype=bool)
+    ghost_mask[ghost_size:-ghost_size, ghost_size:-ghost_size] = False
+    np.testing.assert_array_equal(
+        local_curl[:, ghost_mask], ref_local_curl[:, ghost_mask]
+    )
+    assert np.isnan(local_curl_buffer[-1])
+
     # assert correct
     if mpi_construct.rank == 0:
         outplane_field_curl_pyst_kernel_2d = gen_outplane_field_curl_pyst_kernel_2d(
             real_t=real_t,
         )
-        ref_curl = np.zeros_like(global_curl)
+        ref_curl = np.empty_like(global_curl)
         outplane_field_curl_pyst_kernel_2d(
             curl=ref_curl,
             field=ref_field,
@@ -165,29 +165,17 @@ def test_mpi_brinkmann_penalise_vector_field_3d(
     local_char_field = np.zeros_like(local_vector_field[0])
     local_penalised_vector_field = np.zeros_like(local_vector_field)
 
-    # Initialize and broadcast solution for comparison later
-    if mpi_construct.rank == 0:
-        ref_vector_field = np.random.rand(
-            mpi_construct.grid_dim, grid_size_z, grid_size_y, grid_size_x
-        ).astype(real_t)
-        ref_penalty_vector_field = np.random.rand(
-            mpi_construct.grid_dim, grid_size_z, grid_size_y, grid_size_x
-        ).astype(real_t)
-        ref_char_field = np.random.rand(grid_size_z, grid_size_y, grid_size_x).astype(
-            real_t
-        )
-        penalty_factor = real_t(0.1)
-    else:
-        ref_vector_field = (None,) * mpi_construct.grid_dim
-        ref_penalty_vector_field = (None,) * mpi_construct.grid_dim
-        ref_char_field = None
-        penalty_factor = None
-    ref_vector_field = mpi_construct.grid.bcast(ref_vector_field, root=0)
-    ref_penalty_vector_field = mpi_construct.grid.bcast(
-        ref_penalty_vector_field, root=0
-    )
-    ref_char_field = mpi_construct.grid.bcast(ref_char_field, root=0)
-    penalty_factor = mpi_construct.grid.bcast(penalty_factor, root=0)
+    # Initialize solution for comparison later, identically seeded on all ranks
+    # so that no broadcast is needed
+    rng = np.random.default_rng(seed=0)
+    ref_vector_field = rng.random(
+        (mpi_construct.grid_dim, grid_size_z, grid_size_y, grid_size_x)
+    ).astype(real_t)
+    ref_penalty_vector_field = rng.random(
+        (mpi_construct.grid_dim, grid_size_z, grid_size_y, grid_size_x)
+    ).astype(real_t)
+    ref_char_field = rng.random((grid_size_z, grid_size_y, grid_size_x)).astype(real_t)
+    penalty_factor = real_t(0.1)
 
     # scatter global field
     scatter_global_vector_field(local_vector_field, ref_vector_field)
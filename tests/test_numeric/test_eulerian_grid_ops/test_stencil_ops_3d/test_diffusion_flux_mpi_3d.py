@@ -4,11 +4,6 @@ from sopht.utils.precision import get_real_t, get_test_tol
 from sopht.numeric.eulerian_grid_ops.stencil_ops_3d import (
     gen_diffusion_flux_pyst_kernel_3d,
 )
-from sopht_mpi.utils import (
-    MPIConstruct3D,
-    MPIGhostCommunicator3D,
-    MPIFieldCommunicator3D,
-)
 from sopht_mpi.numeric.eulerian_grid_ops.stencil_ops_3d import (
     gen_diffusion_flux_pyst_mpi_kernel_3d,
 )
@@ -16,20 +11,27 @@ from sopht_mpi.numeric.eulerian_grid_ops.stencil_ops_3d import (
 
 @pytest.mark.mpi(group="MPI_stencil_ops_3d", min_size=4)
 @pytest.mark.parametrize("ghost_size", [1, 2])
-@pytest.mark.parametrize("precision", ["single", "double"])
 @pytest.mark.parametrize(
     "rank_distribution",
     [(0, 1, 1), (1, 0, 1), (1, 1, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
 )
 @pytest.mark.parametrize("aspect_ratio", [(1, 1, 1), (1, 1.5, 2)])
-def test_mpi_diffusion_flux_3d(ghost_size, precision, rank_distribution, aspect_ratio):
+def test_mpi_diffusion_flux_3d(
+    ghost_size,
+    precision,
+    rank_distribution,
+    aspect_ratio,
+    cached_mpi_construct_3d,
+    cached_mpi_ghost_communicator_3d,
+    cached_mpi_field_communicator_3d,
+):
     n_values = 8
     grid_size_z, grid_size_y, grid_size_x = (n_values * np.array(aspect_ratio)).astype(
         int
     )
     real_t = get_real_t(precision)
-    # Generate the MPI topology minimal object
-    mpi_construct = MPIConstruct3D(
+    # Generate (or reuse from an earlier test) the MPI topology minimal object
+    mpi_construct = cached_mpi_construct_3d(
         grid_size_z=grid_size_z,
         grid_size_y=grid_size_y,
         grid_size_x=grid_size_x,
@@ -38,10 +40,10 @@ def test_mpi_diffusion_flux_3d(ghost_size, precision, rank_distribution, aspect_
     )
 
     # extra width needed for kernel computation
-    mpi_ghost_exchange_communicator = MPIGhostCommunicator3D(
+    mpi_ghost_exchange_communicator = cached_mpi_ghost_communicator_3d(
         ghost_size=ghost_size, mpi_construct=mpi_construct
     )
-    mpi_field_communicator = MPIFieldCommunicator3D(
+    mpi_field_communicator = cached_mpi_field_communicator_3d(
         ghost_size=ghost_size, mpi_construct=mpi_construct
     )
     gather_local_scalar_field = mpi_field_communicator.gather_local_scalar_field
@@ -53,18 +55,20 @@ def test_mpi_diffusion_flux_3d(ghost_size, precision, rank_distribution, aspect_
             mpi_construct.local_grid_size[0] + 2 * ghost_size,
             mpi_construct.local_grid_size[1] + 2 * ghost_size,
             mpi_construct.local_grid_size[2] + 2 * ghost_size,
-        )
-    ).astype(real_t)
-    local_diffusion_flux = np.zeros_like(local_field)
+        ),
+        dtype=real_t,
+    )
+    local_diffusion_flux = np.empty_like(local_field)
 
-    # Initialize and broadcast solution for comparison later
+    # Initialize solution for comparison later
     if mpi_construct.rank == 0:
-        ref_field = np.random.rand(grid_size_z, grid_size_y, grid_size_x).astype(real_t)
-        prefactor = real_t(0.1)
+        ref_field = np.random.default_rng().random(
+            (grid_size_z, grid_size_y, grid_size_x), dtype=real_t
+        )
     else:
         ref_field = None
-        prefactor = None
-    prefactor = mpi_construct.grid.bcast(prefactor, root=0)
+    # identical on all ranks, hence needs no broadcast
+    prefactor = real_t(0.1)
 
     # scatter global field
     scatter_global_scalar_field(local_field, ref_field)
@@ -82,8 +86,11 @@ def test_mpi_diffusion_flux_3d(ghost_size, precision, rank_distribution, aspect_
         prefactor=prefactor,
     )
 
-    # gather back the diffusion flux globally
-    global_diffusion_flux = np.zeros_like(ref_field)
+    # gather back the diffusion flux globally (only master needs the global field)
+    if mpi_construct.rank == 0:
+        global_diffusion_flux = np.empty_like(ref_field)
+    else:
+        global_diffusion_flux = None
     gather_local_scalar_field(global_diffusion_flux, local_diffusion_flux)
 
     # assert correct
@@ -91,7 +98,7 @@ def test_mpi_diffusion_flux_3d(ghost_size, precision, rank_distribution, aspect_
         diffusion_flux_pyst_kernel = gen_diffusion_flux_pyst_kernel_3d(
             real_t=real_t,
         )
-        ref_diffusion_flux = np.zeros_like(ref_field)
+        ref_diffusion_flux = np.empty_like(ref_field)
         diffusion_flux_pyst_kernel(
             diffusion_flux=ref_diffusion_flux,
             field=ref_field,
@@ -112,22 +119,27 @@ def test_mpi_diffusion_flux_3d(ghost_size, precision, rank_distribution, aspect_
 
 @pytest.mark.mpi(group="MPI_stencil_ops_3d", min_size=4)
 @pytest.mark.parametrize("ghost_size", [1, 2])
-@pytest.mark.parametrize("precision", ["single", "double"])
 @pytest.mark.parametrize(
     "rank_distribution",
     [(0, 1, 1), (1, 0, 1), (1, 1, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
 )
 @pytest.mark.parametrize("aspect_ratio", [(1, 1, 1), (1, 1.5, 2)])
 def test_mpi_vector_field_diffusion_flux_3d(
-    ghost_size, precision, rank_distribution, aspect_ratio
+    ghost_size,
+    precision,
+    rank_distribution,
+    aspect_ratio,
+    cached_mpi_construct_3d,
+    cached_mpi_ghost_communicator_3d,
+    cached_mpi_field_communicator_3d,
 ):
     n_values = 8
     grid_size_z, grid_size_y, grid_size_x = (n_values * np.array(aspect_ratio)).astype(
         int
     )
     real_t = get_real_t(precision)
-    # Generate the MPI topology minimal object
-    mpi_construct = MPIConstruct3D(
+    # Generate (or reuse from an earlier test) the MPI topology minimal object
+    mpi_construct = cached_mpi_construct_3d(
         grid_size_z=grid_size_z,
         grid_size_y=grid_size_y,
         grid_size_x=grid_size_x,
@@ -136,10 +148,10 @@ def test_mpi_vector_field_diffusion_flux_3d(
     )
 
     # extra width needed for kernel computation
-    mpi_ghost_exchange_communicator = MPIGhostCommunicator3D(
+    mpi_ghost_exchange_communicator = cached_mpi_ghost_communicator_3d(
         ghost_size=ghost_size, mpi_construct=mpi_construct
     )
-    mpi_field_communicator = MPIFieldCommunicator3D(
+    mpi_field_communicator = cached_mpi_field_communicator_3d(
         ghost_size=ghost_size, mpi_construct=mpi_construct
     )
     gather_local_vector_field = mpi_field_communicator.gather_local_vector_field
@@ -152,20 +164,21 @@ def test_mpi_vector_field_diffusion_flux_3d(
             mpi_construct.local_grid_size[0] + 2 * ghost_size,
             mpi_construct.local_grid_size[1] + 2 * ghost_size,
             mpi_construct.local_grid_size[2] + 2 * ghost_size,
-        )
-    ).astype(real_t)
-    local_vector_field_diffusion_flux = np.zeros_like(local_vector_field)
+        ),
+        dtype=real_t,
+    )
+    local_vector_field_diffusion_flux = np.empty_like(local_vector_field)
 
-    # Initialize and broadcast solution for comparison later
+    # Initialize solution for comparison later
     if mpi_construct.rank == 0:
-        ref_vector_field = np.random.rand(
-            mpi_construct.grid_dim, grid_size_z, grid_size_y, grid_size_x
-        ).astype(real_t)
-        prefactor = real_t(0.1)
+        ref_vector_field = np.random.default_rng().random(
+            (mpi_construct.grid_dim, grid_size_z, grid_size_y, grid_size_x),
+            dtype=real_t,
+        )
     else:
         ref_vector_field = (None,) * mpi_construct.grid_dim
-        prefactor = None
-    prefactor = mpi_construct.grid.bcast(prefactor, root=0)
+    # identical on all ranks, hence needs no broadcast
+    prefactor = real_t(0.1)
 
     # scatter global field
     scatter_global_vector_field(local_vector_field, ref_vector_field)
@@ -184,8 +197,11 @@ def test_mpi_vector_field_diffusion_flux_3d(
         prefactor=prefactor,
     )
 
-    # gather back the diffusion flux globally
-    global_vector_field_diffusion_flux = np.zeros_like(ref_vector_field)
+    # gather back the diffusion flux globally (only master needs the global field)
+    if mpi_construct.rank == 0:
+        global_vector_field_diffusion_flux = np.empty_like(ref_vector_field)
+    else:
+        global_vector_field_diffusion_flux = (None,) * mpi_construct.grid_dim
     gather_local_vector_field(
         global_vector_field_diffusion_flux, local_vector_field_diffusion_flux
     )
@@ -195,7 +211,7 @@ def test_mpi_vector_field_diffusion_flux_3d(
         diffusion_flux_pyst_kernel = gen_diffusion_flux_pyst_kernel_3d(
             real_t=real_t, field_type="vector"
         )
-        ref_vector_field_diffusion_flux = np.zeros_like(ref_vector_field)
+        ref_vector_field_diffusion_flux = np.empty_like(ref_vector_field)
         diffusion_flux_pyst_kernel(
             vector_field_diffusion_flux=ref_vector_field_diffusion_flux,
             vector_field=ref_vector_field,
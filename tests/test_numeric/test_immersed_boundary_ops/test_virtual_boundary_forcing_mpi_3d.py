@@ -13,6 +13,17 @@ from sopht.utils.field import VectorField
 from mpi4py import MPI
 
 
+def _bcast_array(mpi_construct, array, shape, dtype):
+    """
+    Broadcast `array` (of `shape` and `dtype`) from rank 0, where it is generated,
+    to all other ranks, on which it is allocated here.
+    """
+    if mpi_construct.rank != 0:
+        array = np.empty(shape, dtype=dtype)
+    mpi_construct.grid.Bcast(array, root=0)
+    return array
+
+
 class ReferenceVirtualBoundaryForcing3D(VirtualBoundaryForcing):
     """Mock solution test class for virtual boundary forcing."""
 
@@ -305,23 +316,22 @@ def test_mpi_compute_lag_grid_velocity_mismatch_field_3d(
 
     # 3. Generate reference fields and test against reference solutions
     # Initialize and broadcast solution for comparison later
+    lag_field_shape = (
+        ref_virtual_boundary_forcing.grid_dim,
+        ref_virtual_boundary_forcing.num_lag_nodes,
+    )
     if mpi_construct.rank == 0:
-        ref_lag_grid_velocity_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
-        ref_lag_grid_flow_velocity_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
+        ref_lag_grid_velocity_field = np.random.rand(*lag_field_shape).astype(real_t)
+        ref_lag_grid_flow_velocity_field = np.random.rand(*lag_field_shape).astype(
+            real_t
+        )
     else:
-        ref_lag_grid_velocity_field = None
-        ref_lag_grid_flow_velocity_field = None
-    ref_lag_grid_velocity_field = mpi_construct.grid.bcast(
-        ref_lag_grid_velocity_field, root=0
+        ref_lag_grid_velocity_field = ref_lag_grid_flow_velocity_field = None
+    ref_lag_grid_velocity_field = _bcast_array(
+        mpi_construct, ref_lag_grid_velocity_field, lag_field_shape, real_t
     )
-    ref_lag_grid_flow_velocity_field = mpi_construct.grid.bcast(
-        ref_lag_grid_flow_velocity_field, root=0
+    ref_lag_grid_flow_velocity_field = _bcast_array(
+        mpi_construct, ref_lag_grid_flow_velocity_field, lag_field_shape, real_t
     )
     ref_lag_grid_velocity_mismatch_field = np.zeros_like(ref_lag_grid_velocity_field)
     # Generate reference solution field
@@ -428,23 +438,26 @@ def test_mpi_update_lag_grid_position_mismatch_field_via_euler_forward_3d(
 
     # 3. Generate reference fields and test against reference solutions
     # Initialize and broadcast solution for comparison later
+    lag_field_shape = (
+        ref_virtual_boundary_forcing.grid_dim,
+        ref_virtual_boundary_forcing.num_lag_nodes,
+    )
     if mpi_construct.rank == 0:
-        ref_lag_grid_position_mismatch_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
-        ref_lag_grid_velocity_mismatch_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
+        ref_lag_grid_position_mismatch_field = np.random.rand(*lag_field_shape).astype(
+            real_t
+        )
+        ref_lag_grid_velocity_mismatch_field = np.random.rand(*lag_field_shape).astype(
+            real_t
+        )
     else:
-        ref_lag_grid_position_mismatch_field = None
-        ref_lag_grid_velocity_mismatch_field = None
-    ref_lag_grid_position_mismatch_field = mpi_construct.grid.bcast(
-        ref_lag_grid_position_mismatch_field, root=0
+        ref_lag_grid_position_mismatch_field = (
+            ref_lag_grid_velocity_mismatch_field
+        ) = None
+    ref_lag_grid_position_mismatch_field = _bcast_array(
+        mpi_construct, ref_lag_grid_position_mismatch_field, lag_field_shape, real_t
     )
-    ref_lag_grid_velocity_mismatch_field = mpi_construct.grid.bcast(
-        ref_lag_grid_velocity_mismatch_field, root=0
+    ref_lag_grid_velocity_mismatch_field = _bcast_array(
+        mpi_construct, ref_lag_grid_velocity_mismatch_field, lag_field_shape, real_t
     )
     dt = ref_virtual_boundary_forcing.real_t(0.1)
 
@@ -552,23 +565,26 @@ def test_mpi_compute_lag_grid_forcing_field_3d(
 
     # 3. Generate reference fields and test against reference solutions
     # Initialize and broadcast solution for comparison later
+    lag_field_shape = (
+        ref_virtual_boundary_forcing.grid_dim,
+        ref_virtual_boundary_forcing.num_lag_nodes,
+    )
     if mpi_construct.rank == 0:
-        ref_lag_grid_position_mismatch_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
-        ref_lag_grid_velocity_mismatch_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
+        ref_lag_grid_position_mismatch_field = np.random.rand(*lag_field_shape).astype(
+            real_t
+        )
+        ref_lag_grid_velocity_mismatch_field = np.random.rand(*lag_field_shape).astype(
+            real_t
+        )
     else:
-        ref_lag_grid_position_mismatch_field = None
-        ref_lag_grid_velocity_mismatch_field = None
-    ref_lag_grid_position_mismatch_field = mpi_construct.grid.bcast(
-        ref_lag_grid_position_mismatch_field, root=0
+        ref_lag_grid_position_mismatch_field = (
+            ref_lag_grid_velocity_mismatch_field
+        ) = None
+    ref_lag_grid_position_mismatch_field = _bcast_array(
+        mpi_construct, ref_lag_grid_position_mismatch_field, lag_field_shape, real_t
     )
-    ref_lag_grid_velocity_mismatch_field = mpi_construct.grid.bcast(
-        ref_lag_grid_velocity_mismatch_field, root=0
+    ref_lag_grid_velocity_mismatch_field = _bcast_array(
+        mpi_construct, ref_lag_grid_velocity_mismatch_field, lag_field_shape, real_t
     )
     ref_lag_grid_forcing_field = np.zeros_like(ref_lag_grid_position_mismatch_field)
     # Compute reference solution
@@ -688,25 +704,26 @@ def test_mpi_compute_interaction_force_on_lag_grid_3d(
 
     # 3. Generate reference fields and test against reference solutions
     # Initialize and broadcast solution for comparison later
+    lag_field_shape = (
+        ref_virtual_boundary_forcing.grid_dim,
+        ref_virtual_boundary_forcing.num_lag_nodes,
+    )
+    eul_field_shape = (
+        ref_virtual_boundary_forcing.grid_dim,
+        ref_virtual_boundary_forcing.grid_size_z,
+        ref_virtual_boundary_forcing.grid_size_y,
+        ref_virtual_boundary_forcing.grid_size_x,
+    )
     if mpi_construct.rank == 0:
-        ref_lag_grid_velocity_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
-        ref_eul_grid_velocity_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.grid_size_z,
-            ref_virtual_boundary_forcing.grid_size_y,
-            ref_virtual_boundary_forcing.grid_size_x,
-        ).astype(ref_virtual_boundary_forcing.real_t)
+        ref_lag_grid_velocity_field = np.random.rand(*lag_field_shape).astype(real_t)
+        ref_eul_grid_velocity_field = np.random.rand(*eul_field_shape).astype(real_t)
     else:
-        ref_lag_grid_velocity_field = None
-        ref_eul_grid_velocity_field = None
-    ref_lag_grid_velocity_field = mpi_construct.grid.bcast(
-        ref_lag_grid_velocity_field, root=0
+        ref_lag_grid_velocity_field = ref_eul_grid_velocity_field = None
+    ref_lag_grid_velocity_field = _bcast_array(
+        mpi_construct, ref_lag_grid_velocity_field, lag_field_shape, real_t
     )
-    ref_eul_grid_velocity_field = mpi_construct.grid.bcast(
-        ref_eul_grid_velocity_field, root=0
+    ref_eul_grid_velocity_field = _bcast_array(
+        mpi_construct, ref_eul_grid_velocity_field, eul_field_shape, real_t
     )
     ref_lag_grid_position_field = ref_virtual_boundary_forcing.lag_positions
 
@@ -873,25 +890,26 @@ def test_mpi_compute_interaction_force_on_eul_and_lag_grid_3d(
 
     # 3. Generate reference fields and test against reference solutions
     # Initialize and broadcast solution for comparison later
+    lag_field_shape = (
+        ref_virtual_boundary_forcing.grid_dim,
+        ref_virtual_boundary_forcing.num_lag_nodes,
+    )
+    eul_field_shape = (
+        ref_virtual_boundary_forcing.grid_dim,
+        ref_virtual_boundary_forcing.grid_size_z,
+        ref_virtual_boundary_forcing.grid_size_y,
+        ref_virtual_boundary_forcing.grid_size_x,
+    )
     if mpi_construct.rank == 0:
-        ref_lag_grid_velocity_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
-        ref_eul_grid_velocity_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.grid_size_z,
-            ref_virtual_boundary_forcing.grid_size_y,
-            ref_virtual_boundary_forcing.grid_size_x,
-        ).astype(ref_virtual_boundary_forcing.real_t)
+        ref_lag_grid_velocity_field = np.random.rand(*lag_field_shape).astype(real_t)
+        ref_eul_grid_velocity_field = np.random.rand(*eul_field_shape).astype(real_t)
     else:
-        ref_lag_grid_velocity_field = None
-        ref_eul_grid_velocity_field = None
-    ref_lag_grid_velocity_field = mpi_construct.grid.bcast(
-        ref_lag_grid_velocity_field, root=0
+        ref_lag_grid_velocity_field = ref_eul_grid_velocity_field = None
+    ref_lag_grid_velocity_field = _bcast_array(
+        mpi_construct, ref_lag_grid_velocity_field, lag_field_shape, real_t
     )
-    ref_eul_grid_velocity_field = mpi_construct.grid.bcast(
-        ref_eul_grid_velocity_field, root=0
+    ref_eul_grid_velocity_field = _bcast_array(
+        mpi_construct, ref_eul_grid_velocity_field, eul_field_shape, real_t
     )
     ref_lag_grid_position_field = ref_virtual_boundary_forcing.lag_positions
     ref_eul_grid_forcing_field = np.zeros_like(ref_eul_grid_velocity_field)
@@ -1073,23 +1091,26 @@ def test_mpi_virtual_boundary_forcing_time_step_3d(
 
     # 3. Generate reference fields and test against reference solutions
     # Initialize and broadcast solution for comparison later
+    lag_field_shape = (
+        ref_virtual_boundary_forcing.grid_dim,
+        ref_virtual_boundary_forcing.num_lag_nodes,
+    )
     if mpi_construct.rank == 0:
-        ref_lag_grid_position_mismatch_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
-        ref_lag_grid_velocity_mismatch_field = np.random.rand(
-            ref_virtual_boundary_forcing.grid_dim,
-            ref_virtual_boundary_forcing.num_lag_nodes,
-        ).astype(ref_virtual_boundary_forcing.real_t)
+        ref_lag_grid_position_mismatch_field = np.random.rand(*lag_field_shape).astype(
+            real_t
+        )
+        ref_lag_grid_velocity_mismatch_field = np.random.rand(*lag_field_shape).astype(
+            real_t
+        )
     else:
-        ref_lag_grid_position_mismatch_field = None
-        ref_lag_grid_velocity_mismatch_field = None
-    ref_lag_grid_position_mismatch_field = mpi_construct.grid.bcast(
-        ref_lag_grid_position_mismatch_field, root=0
-    )
-    ref_lag_grid_velocity_mismatch_field = mpi_construct.grid.bcast(
-        ref_lag_grid_velocity_mismatch_field, root=0
+        ref_lag_grid_position_mismatch_field = (
+            ref_lag_grid_velocity_mismatch_field
+        ) = None
+    ref_lag_grid_position_mismatch_field = _bcast_array(
+        mpi_construct, ref_lag_grid_position_mismatch_field, lag_field_shape, real_t
+    )
+    ref_lag_grid_velocity_mismatch_field = _bcast_array(
+        mpi_construct, ref_lag_grid_velocity_mismatch_field, lag_field_shape, real_t
     )
     dt = ref_virtual_boundary_forcing.real_t(0.1)
     # Compute reference solution after making a copy for testing
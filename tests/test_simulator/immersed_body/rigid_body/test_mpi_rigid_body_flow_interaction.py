@@ -2,7 +2,6 @@ import pytest
 import numpy as np
 import sopht_mpi.simulator as sps
 from sopht.utils.precision import get_real_t
-from sopht_mpi.utils import MPIConstruct2D, MPIGhostCommunicator2D
 import elastica as ea
 from sopht.simulator.immersed_body import CircularCylinderForcingGrid
 
@@ -25,17 +24,20 @@ def mock_2d_cylinder():
 @pytest.mark.mpi(group="MPI_rigid_body_flow_interaction", min_size=4)
 @pytest.mark.parametrize("precision", ["single", "double"])
 @pytest.mark.parametrize("master_rank", [0, 1])
-def test_mpi_rigid_body_flow_interaction(precision, master_rank):
-    # Initialize minimal mpi constructs
+def test_mpi_rigid_body_flow_interaction(
+    precision, master_rank, cached_mpi_construct_2d, cached_mpi_ghost_communicator_2d
+):
+    # Initialize (or reuse, since they do not depend on master_rank) minimal mpi
+    # constructs
     grid_size = (16, 16)
     real_t = get_real_t(precision)
-    mpi_construct = MPIConstruct2D(
+    mpi_construct = cached_mpi_construct_2d(
         grid_size_y=grid_size[0],
         grid_size_x=grid_size[1],
         real_t=real_t,
     )
     ghost_size = 2
-    mpi_ghost_exchange_communicator = MPIGhostCommunicator2D(
+    mpi_ghost_exchange_communicator = cached_mpi_ghost_communicator_2d(
         ghost_size=ghost_size, mpi_construct=mpi_construct
     )
 
@@ -31,29 +31,28 @@ def test_mpi_field_gather_scatter(
     mpi_field_communicator = MPIFieldCommunicator2D(
         ghost_size=ghost_size, mpi_construct=mpi_construct, master_rank=master_rank
     )
-    global_scalar_field = np.random.rand(
-        mpi_construct.global_grid_size[0], mpi_construct.global_grid_size[1]
-    ).astype(real_t)
-    global_vector_field = np.random.rand(
-        mpi_construct.grid_dim,
-        mpi_construct.global_grid_size[0],
-        mpi_construct.global_grid_size[1],
-    ).astype(real_t)
-    ref_global_scalar_field = global_scalar_field.copy()
-    ref_global_vector_field = global_vector_field.copy()
-    local_scalar_field = np.zeros(
-        (
-            mpi_construct.local_grid_size[0] + 2 * ghost_size,
-            mpi_construct.local_grid_size[1] + 2 * ghost_size,
-        )
-    ).astype(real_t)
-    local_vector_field = np.zeros(
-        (
-            mpi_construct.grid_dim,
-            mpi_construct.local_grid_size[0] + 2 * ghost_size,
-            mpi_construct.local_grid_size[1] + 2 * ghost_size,
+    # global fields are only used on master rank, hence only generated there
+    if mpi_construct.rank == master_rank:
+        # scalar and vector fields are views over one pool of grid_dim + 1 fields
+        rng = np.random.default_rng()
+        ref_global_fields = rng.random(
+            (mpi_construct.grid_dim + 1, *mpi_construct.global_grid_size), dtype=real_t
         )
-    ).astype(real_t)
+        ref_global_scalar_field = ref_global_fields[0]
+        ref_global_vector_field = ref_global_fields[1:]
+        # zero initialised, so that gather has to restore the reference values
+        global_fields = np.zeros_like(ref_global_fields)
+        global_scalar_field = global_fields[0]
+        global_vector_field = global_fields[1:]
+    else:
+        ref_global_scalar_field = global_scalar_field = None
+        ref_global_vector_field = global_vector_field = (None,) * mpi_construct.grid_dim
+    local_fields = np.zeros(
+        (mpi_construct.grid_dim + 1, *(mpi_construct.local_grid_size + 2 * ghost_size)),
+        dtype=real_t,
+    )
+    local_scalar_field = local_fields[0]
+    local_vector_field = local_fields[1:]
     gather_local_scalar_field = mpi_field_communicator.gather_local_scalar_field
     scatter_global_scalar_field = mpi_field_communicator.scatter_global_scalar_field
     gather_local_vector_field = mpi_field_communicator.gather_local_vector_field
@@ -61,21 +60,12 @@ def test_mpi_field_gather_scatter(
     # scatter global field to other ranks
     scatter_global_scalar_field(local_scalar_field, ref_global_scalar_field)
     scatter_global_vector_field(local_vector_field, ref_global_vector_field)
-    # randomise global field after scatter
-    global_scalar_field[...] = np.random.rand(
-        mpi_construct.global_grid_size[0], mpi_construct.global_grid_size[1]
-    ).astype(real_t)
-    global_vector_field[...] = np.random.rand(
-        mpi_construct.grid_dim,
-        mpi_construct.global_grid_size[0],
-        mpi_construct.global_grid_size[1],
-    ).astype(real_t)
     # reconstruct global field from local ranks
     gather_local_scalar_field(global_scalar_field, local_scalar_field)
     gather_local_vector_field(global_vector_field, local_vector_field)
     if mpi_construct.rank == master_rank:
-        np.testing.assert_allclose(ref_global_scalar_field, global_scalar_field)
-        np.testing.assert_allclose(ref_global_vector_field, global_vector_field)
+        np.testing.assert_array_equal(ref_global_scalar_field, global_scalar_field)
+        np.testing.assert_array_equal(ref_global_vector_field, global_vector_field)
 
 
 @pytest.mark.mpi(group="MPI_utils", min_size=4)
@@ -106,17 +96,14 @@ def test_mpi_ghost_communication(
         mpi_construct=mpi_construct,
         full_exchange=full_exchange,
     )
-    # Set internal field to manufactured values
-    np.random.seed(0)
-    local_scalar_field = np.random.rand(
-        mpi_construct.local_grid_size[0] + 2 * ghost_size,
-        mpi_construct.local_grid_size[1] + 2 * ghost_size,
-    ).astype(real_t)
-    local_vector_field = np.random.rand(
-        mpi_construct.grid_dim,
-        mpi_construct.local_grid_size[0] + 2 * ghost_size,
-        mpi_construct.local_grid_size[1] + 2 * ghost_size,
-    ).astype(real_t)
+    # Set internal field to manufactured values (identical on all ranks)
+    rng = np.random.default_rng(seed=0)
+    local_fields = rng.random(
+        (mpi_construct.grid_dim + 1, *(mpi_construct.local_grid_size + 2 * ghost_size)),
+        dtype=real_t,
+    )
+    local_scalar_field = local_fields[0]
+    local_vector_field = local_fields[1:]
 
     # ghost comm.
     mpi_ghost_exchange_communicator.exchange_scalar_field_init(local_scalar_field)
@@ -125,70 +112,70 @@ def test_mpi_ghost_communication(
 
     # check if comm. done rightly!
     # Test scalar field
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         local_scalar_field[ghost_size : 2 * ghost_size, ghost_size:-ghost_size],
         local_scalar_field[
             -ghost_size : local_scalar_field.shape[0], ghost_size:-ghost_size
         ],
     )
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         local_scalar_field[-2 * ghost_size : -ghost_size, ghost_size:-ghost_size],
         local_scalar_field[0:ghost_size, ghost_size:-ghost_size],
     )
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         local_scalar_field[ghost_size:-ghost_size, ghost_size : 2 * ghost_size],
         local_scalar_field[
             ghost_size:-ghost_size, -ghost_size : local_scalar_field.shape[1]
         ],
     )
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         local_scalar_field[ghost_size:-ghost_size, -2 * ghost_size : -ghost_size],
         local_scalar_field[ghost_size:-ghost_size, 0:ghost_size],
     )
     # Test vector field
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         local_vector_field[:, ghost_size : 2 * ghost_size, ghost_size:-ghost_size],
         local_vector_field[
             :, -ghost_size : local_vector_field.shape[1], ghost_size:-ghost_size
         ],
     )
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         local_vector_field[:, -2 * ghost_size : -ghost_size, ghost_size:-ghost_size],
         local_vector_field[:, 0:ghost_size, ghost_size:-ghost_size],
     )
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         local_vector_field[:, ghost_size:-ghost_size, ghost_size : 2 * ghost_size],
         local_vector_field[
             :, ghost_size:-ghost_size, -ghost_size : local_vector_field.shape[2]
         ],
     )
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         local_vector_field[:, ghost_size:-ghost_size, -2 * ghost_size : -ghost_size],
         local_vector_field[:, ghost_size:-ghost_size, 0:ghost_size],
     )
 
     if full_exchange:
         # Check bottom left (ghost cell) == top right (inner cell)
-        np.testing.assert_allclose(
+        np.testing.assert_array_equal(
             local_scalar_field[:ghost_size, :ghost_size],  # bottom left (ghost cell)
             local_scalar_field[
                 -2 * ghost_size : -ghost_size, -2 * ghost_size : -ghost_size
             ],  # top right (inner cell)
         )
-        np.testing.assert_allclose(
+        np.testing.assert_array_equal(
             local_vector_field[:, :ghost_size, :ghost_size],  # bottom left (ghost cell)
             local_vector_field[
                 :, -2 * ghost_size : -ghost_size, -2 * ghost_size : -ghost_size
             ],  # top right (inner cell)
         )
         # Check bottom right (ghost cell) == top left (inner cell)
-        np.testing.assert_allclose(
+        np.testing.assert_array_equal(
             local_scalar_field[:ghost_size, -ghost_size:],  # bottom right (ghost cell)
             local_scalar_field[
                 -2 * ghost_size : -ghost_size, ghost_size : 2 * ghost_size
             ],  # top left (inner cell)
         )
-        np.testing.assert_allclose(
+        np.testing.assert_array_equal(
             local_vector_field[
                 :, :ghost_size, -ghost_size:
             ],  # bottom right (ghost cell)
@@ -197,26 +184,26 @@ def test_mpi_ghost_communication(
             ],  # top left (inner cell)
         )
         # Check top left (ghost cell) == bottom right (inner cell)
-        np.testing.assert_allclose(
+        np.testing.assert_array_equal(
             local_scalar_field[-ghost_size:, :ghost_size],  # top left (ghost cell)
             local_scalar_field[
                 ghost_size : 2 * ghost_size, -2 * ghost_size : -ghost_size
             ],  # bottom right (inner cell)
         )
-        np.testing.assert_allclose(
+        np.testing.assert_array_equal(
             local_vector_field[:, -ghost_size:, :ghost_size],  # top left (ghost cell)
             local_vector_field[
                 :, ghost_size : 2 * ghost_size, -2 * ghost_size : -ghost_size
             ],  # bottom right (inner cell)
         )
         # Check top right (ghost cell) == bottom left (inner cell)
-        np.testing.assert_allclose(
+        np.testing.assert_array_equal(
             local_scalar_field[-ghost_size:, -ghost_size:],  # top right (ghost cell)
             local_scalar_field[
                 ghost_size : 2 * ghost_size, ghost_size : 2 * ghost_size
             ],  # bottom left (inner cell)
         )
-        np.testing.assert_allclose(
+        np.testing.assert_array_equal(
             local_vector_field[:, -ghost_size:, -ghost_size:],  # top right (ghost cell)
             local_vector_field[
                 :, ghost_size : 2 * ghost_size, ghost_size : 2 * ghost_size
@@ -340,9 +327,10 @@ def test_mpi_lagrangian_field_gather_scatter(
     # Initialize fields for testing
     global_num_lag_nodes = 100
     # generate random lagrangian nodes within eulerian bounds
-    global_lagrangian_positions = np.zeros(
-        (mpi_lagrangian_field_communicator.grid_dim, global_num_lag_nodes)
-    ).astype(real_t)
+    global_lagrangian_positions = np.empty(
+        (mpi_lagrangian_field_communicator.grid_dim, global_num_lag_nodes),
+        dtype=real_t,
+    )
     global_lagrangian_positions[VectorField.x_axis_idx(), :] = np.random.uniform(
         2 * eul_grid_coord_shift,
         x_range - 2 * eul_grid_coord_shift,
@@ -369,8 +357,9 @@ def test_mpi_lagrangian_field_gather_scatter(
         (
             mpi_lagrangian_field_communicator.grid_dim,
             mpi_lagrangian_field_communicator.local_num_lag_nodes,
-        )
-    ).astype(real_t)
+        ),
+        dtype=real_t,
+    )
     local_lagrangian_velocities = np.zeros_like(local_lagrangian_positions)
 
     # scatter global field to other ranks
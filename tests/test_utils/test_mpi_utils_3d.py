@@ -1,5 +1,7 @@
+import itertools
 import numpy as np
 import pytest
+import weakref
 from sopht.utils.precision import get_real_t
 from sopht.utils.field import VectorField
 from sopht_mpi.utils import (
@@ -24,48 +26,49 @@ from mpi4py import MPI
 )
 @pytest.mark.parametrize("master_rank", [0, 1])
 def test_mpi_field_gather_scatter(
-    ghost_size, precision, rank_distribution, aspect_ratio, master_rank
+    ghost_size,
+    precision,
+    rank_distribution,
+    aspect_ratio,
+    master_rank,
+    cached_mpi_construct_3d,
+    cached_mpi_field_communicator_3d,
 ):
     n_values = 8
     real_t = get_real_t(precision)
-    mpi_construct = MPIConstruct3D(
+    # constructs and communicators are shared by all cases with the same topology
+    mpi_construct = cached_mpi_construct_3d(
         grid_size_z=n_values * aspect_ratio[0],
         grid_size_y=n_values * aspect_ratio[1],
         grid_size_x=n_values * aspect_ratio[2],
         real_t=real_t,
         rank_distribution=rank_distribution,
     )
-    mpi_field_communicator = MPIFieldCommunicator3D(
+    mpi_field_communicator = cached_mpi_field_communicator_3d(
         ghost_size=ghost_size, mpi_construct=mpi_construct, master_rank=master_rank
     )
-    global_scalar_field = np.random.rand(
-        mpi_construct.global_grid_size[0],
-        mpi_construct.global_grid_size[1],
-        mpi_construct.global_grid_size[2],
-    ).astype(real_t)
-    global_vector_field = np.random.rand(
-        mpi_construct.grid_dim,
-        mpi_construct.global_grid_size[0],
-        mpi_construct.global_grid_size[1],
-        mpi_construct.global_grid_size[2],
-    ).astype(real_t)
-    ref_global_scalar_field = global_scalar_field.copy()
-    ref_global_vector_field = global_vector_field.copy()
-    local_scalar_field = np.zeros(
-        (
-            mpi_construct.local_grid_size[0] + 2 * ghost_size,
-            mpi_construct.local_grid_size[1] + 2 * ghost_size,
-            mpi_construct.local_grid_size[2] + 2 * ghost_size,
-        )
-    ).astype(real_t)
-    local_vector_field = np.zeros(
-        (
-            mpi_construct.grid_dim,
-            mpi_construct.local_grid_size[0] + 2 * ghost_size,
-            mpi_construct.local_grid_size[1] + 2 * ghost_size,
-            mpi_construct.local_grid_size[2] + 2 * ghost_size,
-        )
-    ).astype(real_t)
+    # global fields are only used on master rank, hence only generated there
+    if mpi_construct.rank == master_rank:
+        # scalar and vector fields are views over one pool of grid_dim + 1 fields
+        rng = np.random.default_rng()
+        ref_global_fields = rng.random(
+            (mpi_construct.grid_dim + 1, *mpi_construct.global_grid_size), dtype=real_t
+        )
+        ref_global_scalar_field = ref_global_fields[0]
+        ref_global_vector_field = ref_global_fields[1:]
+        # zero initialised, so that gather has to restore the reference values
+        global_fields = np.zeros_like(ref_global_fields)
+        global_scalar_field = global_fields[0]
+        global_vector_field = global_fields[1:]
+    else:
+        ref_global_scalar_field = global_scalar_field = None
+        ref_global_vector_field = global_vector_field = (None,) * mpi_construct.grid_dim
+    local_fields = np.zeros(
+        (mpi_construct.grid_dim + 1, *(mpi_construct.local_grid_size + 2 * ghost_size)),
+        dtype=real_t,
+    )
+    local_scalar_field = local_fields[0]
+    local_vector_field = local_fields[1:]
     gather_local_scalar_field = mpi_field_communicator.gather_local_scalar_field
     scatter_global_scalar_field = mpi_field_communicator.scatter_global_scalar_field
     gather_local_vector_field = mpi_field_communicator.gather_local_vector_field
@@ -73,24 +76,94 @@ def test_mpi_field_gather_scatter(
     # scatter global field to other ranks
     scatter_global_scalar_field(local_scalar_field, ref_global_scalar_field)
     scatter_global_vector_field(local_vector_field, ref_global_vector_field)
-    # randomise global field after scatter
-    global_scalar_field[...] = np.random.rand(
-        mpi_construct.global_grid_size[0],
-        mpi_construct.global_grid_size[1],
-        mpi_construct.global_grid_size[2],
-    ).astype(real_t)
-    global_vector_field[...] = np.random.rand(
-        mpi_construct.grid_dim,
-        mpi_construct.global_grid_size[0],
-        mpi_construct.global_grid_size[1],
-        mpi_construct.global_grid_size[2],
-    ).astype(real_t)
     # reconstruct global field from local ranks
     gather_local_scalar_field(global_scalar_field, local_scalar_field)
     gather_local_vector_field(global_vector_field, local_vector_field)
     if mpi_construct.rank == master_rank:
-        np.testing.assert_allclose(ref_global_scalar_field, global_scalar_field)
-        np.testing.assert_allclose(ref_global_vector_field, global_vector_field)
+        np.testing.assert_array_equal(ref_global_scalar_field, global_scalar_field)
+        np.testing.assert_array_equal(ref_global_vector_field, global_vector_field)
+
+
+@pytest.mark.mpi(group="MPI_utils", min_size=4)
+@pytest.mark.parametrize("precision", ["single", "double"])
+@pytest.mark.parametrize("global_layout", ["components", "strided"])
+@pytest.mark.parametrize("master_rank", [0, 1])
+def test_mpi_vector_field_gather_scatter_non_contiguous_global(
+    precision,
+    global_layout,
+    master_rank,
+    cached_mpi_construct_3d,
+    cached_mpi_field_communicator_3d,
+):
+    n_values = 8
+    ghost_size = 1
+    real_t = get_real_t(precision)
+    mpi_construct = cached_mpi_construct_3d(
+        grid_size_z=n_values,
+        grid_size_y=n_values,
+        grid_size_x=n_values,
+        real_t=real_t,
+        rank_distribution=(0, 1, 1),
+    )
+    mpi_field_communicator = cached_mpi_field_communicator_3d(
+        ghost_size=ghost_size, mpi_construct=mpi_construct, master_rank=master_rank
+    )
+    global_vector_field_shape = (
+        mpi_construct.grid_dim,
+        *mpi_construct.global_grid_size,
+    )
+    if mpi_construct.rank == master_rank:
+        rng = np.random.default_rng()
+        ref_global_vector_field = rng.random(global_vector_field_shape, dtype=real_t)
+        if global_layout == "components":
+            global_vector_field = tuple(
+                np.zeros(mpi_construct.global_grid_size, dtype=real_t)
+                for _ in range(mpi_construct.grid_dim)
+            )
+            scattered_global_vector_field = tuple(ref_global_vector_field)
+        else:
+            # component axis last, hence the components are strided views
+            global_vector_field = np.zeros(
+                (*mpi_construct.global_grid_size, mpi_construct.grid_dim),
+                dtype=real_t,
+            ).transpose(3, 0, 1, 2)
+            scattered_global_vector_field = np.moveaxis(
+                np.moveaxis(ref_global_vector_field, 0, -1).copy(), -1, 0
+            )
+    else:
+        ref_global_vector_field = global_vector_field = (None,) * mpi_construct.grid_dim
+        scattered_global_vector_field = global_vector_field
+    local_vector_field = np.zeros(
+        (mpi_construct.grid_dim, *(mpi_construct.local_grid_size + 2 * ghost_size)),
+        dtype=real_t,
+    )
+    mpi_field_communicator.scatter_global_vector_field(
+        local_vector_field, scattered_global_vector_field
+    )
+    mpi_field_communicator.gather_local_vector_field(
+        global_vector_field, local_vector_field
+    )
+    if mpi_construct.rank == master_rank:
+        np.testing.assert_array_equal(
+            ref_global_vector_field, np.stack(global_vector_field)
+        )
+
+
+@pytest.mark.mpi(group="MPI_utils", min_size=4)
+def test_mpi_field_communicator_too_large_global_grid():
+    # displacement of the last z slab is beyond the int32 range, no fields are
+    # allocated hence the grid size is only bookkeeping here
+    n_values = 2048
+    mpi_construct = MPIConstruct3D(
+        grid_size_z=n_values,
+        grid_size_y=n_values,
+        grid_size_x=n_values,
+        real_t=np.float32,
+        rank_distribution=(0, 1, 1),
+    )
+    with pytest.raises(ValueError):
+        MPIFieldCommunicator3D(ghost_size=1, mpi_construct=mpi_construct)
+    mpi_construct.grid.Free()
 
 
 @pytest.mark.mpi(group="MPI_utils", min_size=4)
@@ -105,12 +178,21 @@ def test_mpi_field_gather_scatter(
     [(1, 1, 1), (1, 1, 2), (1, 2, 1), (2, 1, 1), (1, 2, 2), (2, 1, 2), (2, 2, 1)],
 )
 @pytest.mark.parametrize("full_exchange", [True, False])
+@pytest.mark.parametrize("pack_faces", [True, False])
 def test_mpi_ghost_communication(
-    ghost_size, precision, rank_distribution, aspect_ratio, full_exchange
+    ghost_size,
+    precision,
+    rank_distribution,
+    aspect_ratio,
+    full_exchange,
+    pack_faces,
+    cached_mpi_construct_3d,
+    cached_mpi_ghost_communicator_3d,
 ):
     n_values = 8
     real_t = get_real_t(precision)
-    mpi_construct = MPIConstruct3D(
+    # constructs are shared by all cases with the same topology
+    mpi_construct = cached_mpi_construct_3d(
         grid_size_z=n_values * aspect_ratio[0],
         grid_size_y=n_values * aspect_ratio[1],
         grid_size_x=n_values * aspect_ratio[2],
@@ -118,23 +200,22 @@ def test_mpi_ghost_communication(
         real_t=real_t,
         rank_distribution=rank_distribution,
     )
-    # extra width needed for kernel computation
-    mpi_ghost_exchange_communicator = MPIGhostCommunicator3D(
-        ghost_size=ghost_size, mpi_construct=mpi_construct, full_exchange=full_exchange
+    # extra width needed for kernel computation, communicators (and their
+    # committed datatypes) are shared by all cases with the same configuration
+    mpi_ghost_exchange_communicator = cached_mpi_ghost_communicator_3d(
+        ghost_size=ghost_size,
+        mpi_construct=mpi_construct,
+        full_exchange=full_exchange,
+        pack_faces=pack_faces,
     )
-    # Set internal field to manufactured values
-    np.random.seed(0)
-    local_scalar_field = np.random.rand(
-        mpi_construct.local_grid_size[0] + 2 * ghost_size,
-        mpi_construct.local_grid_size[1] + 2 * ghost_size,
-        mpi_construct.local_grid_size[2] + 2 * ghost_size,
-    ).astype(real_t)
-    local_vector_field = np.random.rand(
-        mpi_construct.grid_dim,
-        mpi_construct.local_grid_size[0] + 2 * ghost_size,
-        mpi_construct.local_grid_size[1] + 2 * ghost_size,
-        mpi_construct.local_grid_size[2] + 2 * ghost_size,
-    ).astype(real_t)
+    # Set internal field to manufactured values (identical on all ranks)
+    rng = np.random.default_rng(seed=0)
+    local_fields = rng.random(
+        (mpi_construct.grid_dim + 1, *(mpi_construct.local_grid_size + 2 * ghost_size)),
+        dtype=real_t,
+    )
+    local_scalar_field = local_fields[0]
+    local_vector_field = local_fields[1:]
 
     # ghost comm.
     mpi_ghost_exchange_communicator.exchange_scalar_field_init(local_scalar_field)
@@ -142,644 +223,293 @@ def test_mpi_ghost_communication(
     mpi_ghost_exchange_communicator.exchange_finalise()
 
     # check if comm. done rightly!
-    # (1) Test faces
-    # Comm. along (0, 0, -X)
-    np.testing.assert_allclose(
-        local_scalar_field[
-            ghost_size:-ghost_size, ghost_size:-ghost_size, ghost_size : 2 * ghost_size
-        ],
-        local_scalar_field[
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-            -ghost_size : local_scalar_field.shape[2],
-        ],
+    # Since the (periodic) local fields are identical on all ranks, the ghost zone
+    # on the end opposite to a direction should hold the inner zone along that
+    # direction. Directions shifted along one axis are faces, and along two or three
+    # axes are edges and vertices, which are exchanged only with full_exchange.
+    def inner_and_ghost_slices(direction):
+        if direction == -1:
+            return slice(ghost_size, 2 * ghost_size), slice(-ghost_size, None)
+        if direction == +1:
+            return slice(-2 * ghost_size, -ghost_size), slice(0, ghost_size)
+        return slice(ghost_size, -ghost_size), slice(ghost_size, -ghost_size)
+
+    for direction in itertools.product((-1, 0, +1), repeat=mpi_construct.grid_dim):
+        num_shifted_axes = np.count_nonzero(direction)
+        if num_shifted_axes == 0 or (num_shifted_axes > 1 and not full_exchange):
+            continue
+        inner_idx, ghost_idx = zip(*map(inner_and_ghost_slices, direction))
+        for field in (local_scalar_field, local_vector_field):
+            np.testing.assert_array_equal(
+                field[(..., *ghost_idx)],
+                field[(..., *inner_idx)],
+                err_msg=str(direction),
+            )
+
+
+@pytest.mark.mpi(group="MPI_utils", min_size=4)
+@pytest.mark.parametrize("ghost_size", [1, 2])
+@pytest.mark.parametrize("precision", ["single", "double"])
+@pytest.mark.parametrize(
+    "rank_distribution",
+    [(0, 1, 1), (1, 0, 1), (1, 1, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
+)
+@pytest.mark.parametrize("pack_faces", [True, False])
+def test_mpi_ghost_communication_repeated_exchange(
+    ghost_size,
+    precision,
+    rank_distribution,
+    pack_faces,
+    cached_mpi_construct_3d,
+    cached_mpi_ghost_communicator_3d,
+):
+    n_values = 8
+    real_t = get_real_t(precision)
+    # reuses the construct and communicator of test_mpi_ghost_communication
+    mpi_construct = cached_mpi_construct_3d(
+        grid_size_z=n_values,
+        grid_size_y=n_values,
+        grid_size_x=n_values,
+        periodic_domain=True,
+        real_t=real_t,
+        rank_distribution=rank_distribution,
     )
-    np.testing.assert_allclose(
-        local_vector_field[
-            :,
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-            ghost_size : 2 * ghost_size,
-        ],
-        local_vector_field[
-            :,
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-            -ghost_size : local_vector_field.shape[3],
-        ],
-    )
-    # Comm. along (0, 0, +X)
-    np.testing.assert_allclose(
-        local_scalar_field[
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-            -2 * ghost_size : -ghost_size,
-        ],
-        local_scalar_field[
-            ghost_size:-ghost_size, ghost_size:-ghost_size, 0:ghost_size
-        ],
+    mpi_ghost_exchange_communicator = cached_mpi_ghost_communicator_3d(
+        ghost_size=ghost_size,
+        mpi_construct=mpi_construct,
+        full_exchange=True,
+        pack_faces=pack_faces,
     )
-    np.testing.assert_allclose(
-        local_vector_field[
-            :,
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-            -2 * ghost_size : -ghost_size,
-        ],
-        local_vector_field[
-            :, ghost_size:-ghost_size, ghost_size:-ghost_size, 0:ghost_size
-        ],
-    )
-    # Comm. along (0, -Y, 0)
-    np.testing.assert_allclose(
-        local_scalar_field[
-            ghost_size:-ghost_size, ghost_size : 2 * ghost_size, ghost_size:-ghost_size
-        ],
-        local_scalar_field[
-            ghost_size:-ghost_size,
-            -ghost_size : local_scalar_field.shape[1],
-            ghost_size:-ghost_size,
-        ],
+    local_scalar_field = np.zeros(
+        mpi_construct.local_grid_size + 2 * ghost_size,
+        dtype=real_t,
     )
-    np.testing.assert_allclose(
-        local_vector_field[
-            :,
-            ghost_size:-ghost_size,
-            ghost_size : 2 * ghost_size,
-            ghost_size:-ghost_size,
-        ],
-        local_vector_field[
-            :,
-            ghost_size:-ghost_size,
-            -ghost_size : local_vector_field.shape[2],
-            ghost_size:-ghost_size,
-        ],
-    )
-    # Comm. along (0, +Y, 0)
-    np.testing.assert_allclose(
-        local_scalar_field[
-            ghost_size:-ghost_size,
-            -2 * ghost_size : -ghost_size,
-            ghost_size:-ghost_size,
-        ],
-        local_scalar_field[
-            ghost_size:-ghost_size, 0:ghost_size, ghost_size:-ghost_size
-        ],
+    local_vector_field = np.zeros(
+        (mpi_construct.grid_dim, *(mpi_construct.local_grid_size + 2 * ghost_size)),
+        dtype=real_t,
     )
-    np.testing.assert_allclose(
-        local_vector_field[
-            :,
-            ghost_size:-ghost_size,
-            -2 * ghost_size : -ghost_size,
-            ghost_size:-ghost_size,
-        ],
-        local_vector_field[
-            :, ghost_size:-ghost_size, 0:ghost_size, ghost_size:-ghost_size
-        ],
-    )
-    # Comm. along (-Z, 0, 0)
-    np.testing.assert_allclose(
-        local_scalar_field[
-            ghost_size : 2 * ghost_size, ghost_size:-ghost_size, ghost_size:-ghost_size
-        ],
-        local_scalar_field[
-            -ghost_size : local_scalar_field.shape[0],
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-        ],
+    inner_idx = (slice(ghost_size, -ghost_size),) * mpi_construct.grid_dim
+
+    # Exchange the same fields over multiple steps (reusing the communication
+    # requests), with identical values on all ranks so that in a periodic domain
+    # the ghost cells are a periodic wrap of the local field.
+    np.random.seed(0)
+    for _ in range(3):
+        local_scalar_field[inner_idx] = np.random.rand(*mpi_construct.local_grid_size)
+        local_vector_field[(slice(None),) + inner_idx] = np.random.rand(
+            mpi_construct.grid_dim, *mpi_construct.local_grid_size
+        )
+        mpi_ghost_exchange_communicator.exchange_scalar_field_init(local_scalar_field)
+        mpi_ghost_exchange_communicator.exchange_vector_field_init(local_vector_field)
+        mpi_ghost_exchange_communicator.exchange_finalise()
+
+        np.testing.assert_array_equal(
+            local_scalar_field,
+            np.pad(local_scalar_field[inner_idx], ghost_size, mode="wrap"),
+        )
+        np.testing.assert_array_equal(
+            local_vector_field,
+            np.pad(
+                local_vector_field[(slice(None),) + inner_idx],
+                ((0, 0),) + ((ghost_size, ghost_size),) * mpi_construct.grid_dim,
+                mode="wrap",
+            ),
+        )
+
+
+@pytest.mark.mpi(group="MPI_utils", min_size=4)
+@pytest.mark.parametrize("ghost_size", [1, 2])
+@pytest.mark.parametrize("precision", ["single", "double"])
+@pytest.mark.parametrize(
+    "rank_distribution",
+    [(0, 1, 1), (1, 0, 1), (1, 1, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
+)
+@pytest.mark.parametrize("pack_faces", [True, False])
+def test_mpi_ghost_communication_split_recvs_and_sends(
+    ghost_size,
+    precision,
+    rank_distribution,
+    pack_faces,
+    cached_mpi_construct_3d,
+    cached_mpi_ghost_communicator_3d,
+):
+    n_values = 8
+    real_t = get_real_t(precision)
+    # reuses the construct and communicator of test_mpi_ghost_communication
+    mpi_construct = cached_mpi_construct_3d(
+        grid_size_z=n_values,
+        grid_size_y=n_values,
+        grid_size_x=n_values,
+        periodic_domain=True,
+        real_t=real_t,
+        rank_distribution=rank_distribution,
     )
-    np.testing.assert_allclose(
-        local_vector_field[
-            :,
-            ghost_size : 2 * ghost_size,
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-        ],
-        local_vector_field[
-            :,
-            -ghost_size : local_vector_field.shape[1],
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-        ],
-    )
-    # Comm. along (+Z, 0, 0)
-    np.testing.assert_allclose(
-        local_scalar_field[
-            -2 * ghost_size : -ghost_size,
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-        ],
-        local_scalar_field[
-            0:ghost_size, ghost_size:-ghost_size, ghost_size:-ghost_size
-        ],
+    mpi_ghost_exchange_communicator = cached_mpi_ghost_communicator_3d(
+        ghost_size=ghost_size,
+        mpi_construct=mpi_construct,
+        full_exchange=True,
+        pack_faces=pack_faces,
+    )
+    local_scalar_field = np.zeros(
+        mpi_construct.local_grid_size + 2 * ghost_size,
+        dtype=real_t,
+    )
+    inner_idx = (slice(ghost_size, -ghost_size),) * mpi_construct.grid_dim
+
+    # Post recvs before the field is updated, and sends after, with identical
+    # values on all ranks so that in a periodic domain the ghost cells are a
+    # periodic wrap of the local field.
+    np.random.seed(0)
+    mpi_ghost_exchange_communicator.exchange_scalar_field_post_recvs(local_scalar_field)
+    local_scalar_field[inner_idx] = np.random.rand(*mpi_construct.local_grid_size)
+    mpi_ghost_exchange_communicator.exchange_scalar_field_post_sends(local_scalar_field)
+    mpi_ghost_exchange_communicator.exchange_finalise()
+
+    np.testing.assert_array_equal(
+        local_scalar_field,
+        np.pad(local_scalar_field[inner_idx], ghost_size, mode="wrap"),
     )
+
+
+@pytest.mark.mpi(group="MPI_utils", min_size=4)
+@pytest.mark.parametrize("ghost_size", [1, 2])
+@pytest.mark.parametrize(
+    "rank_distribution",
+    [(0, 1, 1), (1, 0, 1), (1, 1, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)],
+)
+def test_mpi_ghost_communication_reduced_precision(ghost_size, rank_distribution):
+    n_values = 8
+    real_t = get_real_t("double")
+    comm_dtype = get_real_t("single")
+    mpi_construct = MPIConstruct3D(
+        grid_size_z=n_values,
+        grid_size_y=n_values,
+        grid_size_x=n_values,
+        periodic_domain=True,
+        real_t=real_t,
+        rank_distribution=rank_distribution,
+    )
+    mpi_ghost_exchange_communicator = MPIGhostCommunicator3D(
+        ghost_size=ghost_size,
+        mpi_construct=mpi_construct,
+        full_exchange=True,
+        comm_dtype=comm_dtype,
+    )
+    assert mpi_ghost_exchange_communicator.pack_faces
+    local_scalar_field = np.zeros(
+        mpi_construct.local_grid_size + 2 * ghost_size,
+        dtype=real_t,
+    )
+    inner_idx = (slice(ghost_size, -ghost_size),) * mpi_construct.grid_dim
+
+    # Identical values on all ranks, so that in a periodic domain the ghost cells
+    # are a periodic wrap of the local field (up to the comm. precision).
+    np.random.seed(0)
+    local_scalar_field[inner_idx] = np.random.rand(*mpi_construct.local_grid_size)
+    mpi_ghost_exchange_communicator.exchange_scalar_field_init(local_scalar_field)
+    mpi_ghost_exchange_communicator.exchange_finalise()
+
+    assert local_scalar_field.dtype == real_t
     np.testing.assert_allclose(
-        local_vector_field[
-            :,
-            -2 * ghost_size : -ghost_size,
-            ghost_size:-ghost_size,
-            ghost_size:-ghost_size,
-        ],
-        local_vector_field[
-            :, 0:ghost_size, ghost_size:-ghost_size, ghost_size:-ghost_size
-        ],
+        local_scalar_field,
+        np.pad(local_scalar_field[inner_idx], ghost_size, mode="wrap"),
+        rtol=np.finfo(comm_dtype).eps,
     )
 
-    if full_exchange:
-        # (2) Test edges
-        # Comm. along (0, +Y, +X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size:-ghost_size,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_scalar_field[ghost_size:-ghost_size, 0:ghost_size, 0:ghost_size],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size:-ghost_size,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_vector_field[:, ghost_size:-ghost_size, 0:ghost_size, 0:ghost_size],
-        )
-        # Comm. along (0, -Y, +X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size:-ghost_size,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_scalar_field[
-                ghost_size:-ghost_size,
-                -ghost_size : local_scalar_field.shape[1],
-                0:ghost_size,
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size:-ghost_size,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_vector_field[
-                :,
-                ghost_size:-ghost_size,
-                -ghost_size : local_vector_field.shape[2],
-                0:ghost_size,
-            ],
-        )
-        # Comm. along (0, +Y, -X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size:-ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_scalar_field[
-                ghost_size:-ghost_size,
-                0:ghost_size,
-                -ghost_size : local_scalar_field.shape[2],
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size:-ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_vector_field[
-                :,
-                ghost_size:-ghost_size,
-                0:ghost_size,
-                -ghost_size : local_vector_field.shape[3],
-            ],
-        )
-        # Comm. along (0, -Y, -X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size:-ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_scalar_field[
-                ghost_size:-ghost_size,
-                -ghost_size : local_scalar_field.shape[1],
-                -ghost_size : local_scalar_field.shape[2],
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size:-ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_vector_field[
-                :,
-                ghost_size:-ghost_size,
-                -ghost_size : local_vector_field.shape[2],
-                -ghost_size : local_vector_field.shape[3],
-            ],
-        )
 
-        # Comm. along (+Z, 0, +X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                -2 * ghost_size : -ghost_size,
-                ghost_size:-ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_scalar_field[0:ghost_size, ghost_size:-ghost_size, 0:ghost_size],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                -2 * ghost_size : -ghost_size,
-                ghost_size:-ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_vector_field[:, 0:ghost_size, ghost_size:-ghost_size, 0:ghost_size],
-        )
-        # Comm. along (-Z, 0, +X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size : 2 * ghost_size,
-                ghost_size:-ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_scalar_field[
-                -ghost_size : local_scalar_field.shape[0],
-                ghost_size:-ghost_size,
-                0:ghost_size,
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size : 2 * ghost_size,
-                ghost_size:-ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_vector_field[
-                :,
-                -ghost_size : local_vector_field.shape[1],
-                ghost_size:-ghost_size,
-                0:ghost_size,
-            ],
-        )
-        # Comm. along (+Z, 0, -X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                -2 * ghost_size : -ghost_size,
-                ghost_size:-ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_scalar_field[
-                0:ghost_size,
-                ghost_size:-ghost_size,
-                -ghost_size : local_scalar_field.shape[2],
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                -2 * ghost_size : -ghost_size,
-                ghost_size:-ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_vector_field[
-                :,
-                0:ghost_size,
-                ghost_size:-ghost_size,
-                -ghost_size : local_vector_field.shape[3],
-            ],
-        )
-        # Comm. along (-Z, 0, -X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size : 2 * ghost_size,
-                ghost_size:-ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_scalar_field[
-                -ghost_size : local_scalar_field.shape[0],
-                ghost_size:-ghost_size,
-                -ghost_size : local_scalar_field.shape[2],
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size : 2 * ghost_size,
-                ghost_size:-ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_vector_field[
-                :,
-                -ghost_size : local_vector_field.shape[1],
-                ghost_size:-ghost_size,
-                -ghost_size : local_vector_field.shape[3],
-            ],
-        )
+@pytest.mark.mpi(group="MPI_utils", min_size=4)
+@pytest.mark.parametrize("pack_faces", [True, False])
+def test_mpi_ghost_communication_bounded_persistent_requests(
+    pack_faces, cached_mpi_construct_3d
+):
+    n_values = 8
+    ghost_size = 1
+    cache_size = 4
+    real_t = get_real_t("double")
+    mpi_construct = cached_mpi_construct_3d(
+        grid_size_z=n_values,
+        grid_size_y=n_values,
+        grid_size_x=n_values,
+        periodic_domain=True,
+        real_t=real_t,
+    )
+    mpi_ghost_exchange_communicator = MPIGhostCommunicator3D(
+        ghost_size=ghost_size,
+        mpi_construct=mpi_construct,
+        pack_faces=pack_faces,
+        persistent_requests_cache_size=cache_size,
+    )
+    inner_idx = (slice(ghost_size, -ghost_size),) * mpi_construct.grid_dim
 
-        # Comm. along (+Z, +Y, 0)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size:-ghost_size,
-            ],
-            local_scalar_field[0:ghost_size, 0:ghost_size, ghost_size:-ghost_size],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size:-ghost_size,
-            ],
-            local_vector_field[:, 0:ghost_size, 0:ghost_size, ghost_size:-ghost_size],
-        )
-        # Comm. along (-Z, +Y, 0)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size:-ghost_size,
-            ],
-            local_scalar_field[
-                -ghost_size : local_scalar_field.shape[0],
-                0:ghost_size,
-                ghost_size:-ghost_size,
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size:-ghost_size,
-            ],
-            local_vector_field[
-                :,
-                -ghost_size : local_vector_field.shape[1],
-                0:ghost_size,
-                ghost_size:-ghost_size,
-            ],
-        )
-        # Comm. along (+Z, -Y, 0)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size:-ghost_size,
-            ],
-            local_scalar_field[
-                0:ghost_size,
-                -ghost_size : local_scalar_field.shape[1],
-                ghost_size:-ghost_size,
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size:-ghost_size,
-            ],
-            local_vector_field[
-                :,
-                0:ghost_size,
-                -ghost_size : local_vector_field.shape[2],
-                ghost_size:-ghost_size,
-            ],
-        )
-        # Comm. along (-Z, -Y, 0)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size:-ghost_size,
-            ],
-            local_scalar_field[
-                -ghost_size : local_scalar_field.shape[0],
-                -ghost_size : local_scalar_field.shape[1],
-                ghost_size:-ghost_size,
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size:-ghost_size,
-            ],
-            local_vector_field[
-                :,
-                -ghost_size : local_vector_field.shape[1],
-                -ghost_size : local_vector_field.shape[2],
-                ghost_size:-ghost_size,
-            ],
-        )
+    # Exchange many short lived fields, whose requests should be freed (along
+    # with the references to the fields) once they fall out of the cache.
+    rng = np.random.default_rng(seed=0)
+    field_refs = []
+    for _ in range(3 * cache_size):
+        local_field = np.zeros(mpi_construct.local_grid_size + 2 * ghost_size)
+        local_field[inner_idx] = rng.random(mpi_construct.local_grid_size)
+        mpi_ghost_exchange_communicator.exchange_scalar_field_init(local_field)
+        mpi_ghost_exchange_communicator.exchange_finalise()
+        np.testing.assert_array_equal(
+            local_field, np.pad(local_field[inner_idx], ghost_size, mode="wrap")
+        )
+        field_refs.append(weakref.ref(local_field))
+        del local_field
+        assert len(mpi_ghost_exchange_communicator.persistent_requests) <= cache_size
+    assert all(field_ref() is None for field_ref in field_refs[:-cache_size])
 
-        # (3) Test vertices
-        # Comm. along (+Z, +Y, +X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_scalar_field[0:ghost_size, 0:ghost_size, 0:ghost_size],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_vector_field[:, 0:ghost_size, 0:ghost_size, 0:ghost_size],
-        )
-        # Comm. along (-Z, +Y, +X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_scalar_field[
-                -ghost_size : local_scalar_field.shape[0], 0:ghost_size, 0:ghost_size
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_vector_field[
-                :, -ghost_size : local_vector_field.shape[1], 0:ghost_size, 0:ghost_size
-            ],
-        )
-        # Comm. along (+Z, -Y, +X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_scalar_field[
-                0:ghost_size, -ghost_size : local_scalar_field.shape[1], 0:ghost_size
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_vector_field[
-                :, 0:ghost_size, -ghost_size : local_vector_field.shape[2], 0:ghost_size
-            ],
-        )
-        # Comm. along (+Z, +Y, -X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_scalar_field[
-                0:ghost_size, 0:ghost_size, -ghost_size : local_scalar_field.shape[2]
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                -2 * ghost_size : -ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_vector_field[
-                :, 0:ghost_size, 0:ghost_size, -ghost_size : local_vector_field.shape[3]
-            ],
-        )
-        # Comm. along (-Z, -Y, +X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_scalar_field[
-                -ghost_size : local_scalar_field.shape[0],
-                -ghost_size : local_scalar_field.shape[1],
-                0:ghost_size,
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-            ],
-            local_vector_field[
-                :,
-                -ghost_size : local_vector_field.shape[1],
-                -ghost_size : local_vector_field.shape[2],
-                0:ghost_size,
-            ],
-        )
-        # Comm. along (-Z, +Y, -X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_scalar_field[
-                -ghost_size : local_scalar_field.shape[0],
-                0:ghost_size,
-                -ghost_size : local_scalar_field.shape[2],
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size : 2 * ghost_size,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_vector_field[
-                :,
-                -ghost_size : local_vector_field.shape[1],
-                0:ghost_size,
-                -ghost_size : local_vector_field.shape[3],
-            ],
-        )
-        # Comm. along (+Z, -Y, -X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_scalar_field[
-                0:ghost_size,
-                -ghost_size : local_scalar_field.shape[1],
-                -ghost_size : local_scalar_field.shape[2],
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                -2 * ghost_size : -ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_vector_field[
-                :,
-                0:ghost_size,
-                -ghost_size : local_vector_field.shape[2],
-                -ghost_size : local_vector_field.shape[3],
-            ],
-        )
-        # Comm. along (-Z, -Y, -X)
-        np.testing.assert_allclose(
-            local_scalar_field[
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_scalar_field[
-                -ghost_size : local_scalar_field.shape[0],
-                -ghost_size : local_scalar_field.shape[1],
-                -ghost_size : local_scalar_field.shape[2],
-            ],
-        )
-        np.testing.assert_allclose(
-            local_vector_field[
-                :,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-                ghost_size : 2 * ghost_size,
-            ],
-            local_vector_field[
-                :,
-                -ghost_size : local_vector_field.shape[1],
-                -ghost_size : local_vector_field.shape[2],
-                -ghost_size : local_vector_field.shape[3],
-            ],
-        )
+    mpi_ghost_exchange_communicator.free_persistent_requests()
+    assert not mpi_ghost_exchange_communicator.persistent_requests
+    assert all(field_ref() is None for field_ref in field_refs)
+
+
+@pytest.mark.mpi(group="MPI_utils", min_size=4)
+@pytest.mark.parametrize("full_exchange", [True, False])
+@pytest.mark.parametrize("pack_faces", [True, False])
+def test_mpi_ghost_communication_repeated_init_before_finalise(
+    full_exchange, pack_faces, cached_mpi_construct_3d
+):
+    n_values = 8
+    ghost_size = 1
+    real_t = get_real_t("double")
+    mpi_construct = cached_mpi_construct_3d(
+        grid_size_z=n_values,
+        grid_size_y=n_values,
+        grid_size_x=n_values,
+        periodic_domain=True,
+        real_t=real_t,
+    )
+    mpi_ghost_exchange_communicator = MPIGhostCommunicator3D(
+        ghost_size=ghost_size,
+        mpi_construct=mpi_construct,
+        full_exchange=full_exchange,
+        pack_faces=pack_faces,
+    )
+    rng = np.random.default_rng(seed=0)
+    local_field = rng.random(mpi_construct.local_grid_size + 2 * ghost_size)
+    inner_idx = (slice(ghost_size, -ghost_size),) * mpi_construct.grid_dim
+    faces_idx = [
+        (*inner_idx[:axis], slice(None), *inner_idx[axis + 1 :])
+        for axis in range(mpi_construct.grid_dim)
+    ]
+    ref_field = np.pad(local_field[inner_idx], ghost_size, mode="wrap")
+
+    # exchanging the same field again before finalising falls back to temporary
+    # requests, since the persistent ones are still active
+    mpi_ghost_exchange_communicator.exchange_scalar_field_init(local_field)
+    mpi_ghost_exchange_communicator.exchange_scalar_field_init(local_field)
+    mpi_ghost_exchange_communicator.exchange_finalise()
+    assert not mpi_ghost_exchange_communicator.temporary_requests
+    for face_idx in faces_idx:
+        np.testing.assert_array_equal(local_field[face_idx], ref_field[face_idx])
+    if full_exchange:
+        np.testing.assert_array_equal(local_field, ref_field)
+
+    # the persistent requests are reusable after finalising
+    mpi_ghost_exchange_communicator.exchange_scalar_field_init(local_field)
+    mpi_ghost_exchange_communicator.exchange_finalise()
+    assert len(mpi_ghost_exchange_communicator.persistent_requests) == 1
+    mpi_ghost_exchange_communicator.free_persistent_requests()
 
 
 @pytest.mark.mpi(group="MPI_utils", min_size=4)
@@ -922,9 +652,10 @@ def test_mpi_lagrangian_field_gather_scatter(
     # Initialize fields for testing
     global_num_lag_nodes = 100
     # generate random lagrangian nodes within eulerian bounds
-    global_lagrangian_positions = np.zeros(
-        (mpi_lagrangian_field_communicator.grid_dim, global_num_lag_nodes)
-    ).astype(real_t)
+    global_lagrangian_positions = np.empty(
+        (mpi_lagrangian_field_communicator.grid_dim, global_num_lag_nodes),
+        dtype=real_t,
+    )
     global_lagrangian_positions[VectorField.x_axis_idx(), :] = np.random.uniform(
         2 * eul_grid_coord_shift,
         x_range - 2 * eul_grid_coord_shift,
@@ -956,8 +687,9 @@ def test_mpi_lagrangian_field_gather_scatter(
         (
             mpi_lagrangian_field_communicator.grid_dim,
             mpi_lagrangian_field_communicator.local_num_lag_nodes,
-        )
-    ).astype(real_t)
+        ),
+        dtype=real_t,
+    )
     local_lagrangian_velocities = np.zeros_like(local_lagrangian_positions)
 
     # scatter global field to other ranks